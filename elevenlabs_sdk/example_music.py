@@ -5,6 +5,8 @@ import os
 from dotenv import load_dotenv
 from elevenlabs import ElevenLabs
 
+from elevenlabs_sdk.generator import STREAM_BUFFER_SIZE
+
 
 def main():
     print("=" * 60)
@@ -44,9 +46,8 @@ def main():
 
     # Save the generated audio
     output_path = "chicago_jazz_music.mp3"
-    with open(output_path, "wb") as f:
-        for chunk in audio_data:
-            f.write(chunk)
+    with open(output_path, "wb", buffering=STREAM_BUFFER_SIZE) as f:
+        f.writelines(audio_data)
     print(f"  Saved to: {output_path}")
     print()
 
@@ -1,27 +1,78 @@
 """AI-powered meditation music and sound generation using ElevenLabs."""
 
+import asyncio
+import functools
+import glob
+import hashlib
 import io
 import os
-from typing import Optional
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional
 
-from dotenv import load_dotenv
 from elevenlabs.client import ElevenLabs
 
+# Write buffer for streaming generated audio straight to disk
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Suggested cache location; pass it as cache_dir to opt in to caching
+DEFAULT_CACHE_DIR = "~/.cache/mindful_makers/eleven"
+
+# Part of the cache key so a change of endpoint never serves stale audio
+SOUND_EFFECTS_MODEL = "text_to_sound_effects"
+
+# Model used for Music API generations
+MUSIC_MODEL = "music_v1"
+
+# Wording wrapped around user prompts by the generate_* helpers
+_MEDITATION_PREFIX = "meditation music: "
+_MEDITATION_SUFFIX = ", peaceful, calming, ambient"
+_NATURE_PREFIX = "nature sound recording: "
+_NATURE_SUFFIX = ", high quality field recording, ambient"
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load variables from a .env file, at most once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 class GeneratedAudio:
-    """Container for generated audio data."""
+    """Container for generated audio data.
+
+    Holds either the raw bytes in memory or the path of a file the audio
+    was streamed to. File-backed audio is only read when the bytes are
+    requested.
+    """
 
-    def __init__(self, audio_data: bytes, prompt: str, duration_seconds: float):
+    __slots__ = ("audio_data", "prompt", "duration_seconds", "path")
+
+    def __init__(
+        self,
+        audio_data: Optional[bytes],
+        prompt: str,
+        duration_seconds: float,
+        path: Optional[str] = None,
+    ):
         """Initialize with audio data.
 
         Args:
-            audio_data: Raw audio bytes
+            audio_data: Raw audio bytes, or None if the audio lives at path
             prompt: The prompt used to generate this audio
             duration_seconds: Requested duration
+            path: File holding the audio when audio_data is not kept in memory
         """
+        if audio_data is None and path is None:
+            raise ValueError("Either audio_data or path is required.")
+
         self.audio_data = audio_data
         self.prompt = prompt
         self.duration_seconds = duration_seconds
+        self.path = path
 
     def save(self, path: str) -> str:
         """Save audio to file.
@@ -32,18 +83,26 @@ class GeneratedAudio:
         Returns:
             Path to saved file
         """
-        with open(path, "wb") as f:
-            f.write(self.audio_data)
+        if self.audio_data is None:
+            if os.path.abspath(path) != os.path.abspath(self.path):
+                shutil.copyfile(self.path, path)
+        else:
+            with open(path, "wb") as f:
+                f.write(self.audio_data)
         print(f"Saved: {path}")
         return path
 
     def get_bytes(self) -> bytes:
         """Get raw audio bytes."""
+        if self.audio_data is None:
+            with open(self.path, "rb") as f:
+                return f.read()
         return self.audio_data
 
     def get_bytesio(self) -> io.BytesIO:
         """Get audio as BytesIO for streaming."""
-        return io.BytesIO(self.audio_data)
+        # BytesIO shares an immutable bytes payload until it is written to
+        return io.BytesIO(self.get_bytes())
 
 
 class MeditationGenerator:
@@ -89,13 +148,33 @@ class MeditationGenerator:
         },
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Prompts for generate_transition_sound(), keyed by sound type
+    _TRANSITION_PROMPTS = {
+        "bell": "single meditation bell strike, clear resonant tone, peaceful",
+        "chime": "gentle wind chimes, soft melodic tones, peaceful transition",
+        "bowl": "tibetan singing bowl being struck, deep resonant harmonic tone",
+        "gong": "soft gong strike, deep resonant wash of sound, meditation",
+    }
+
+    # Read-only name -> description view, built once at import
+    _PRESET_DESCRIPTIONS = MappingProxyType(
+        {name: config["description"] for name, config in PRESETS.items()}
+    )
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """Initialize the generator.
 
         Args:
             api_key: ElevenLabs API key. If not provided, looks for ELEVENLABS_API_KEY env var.
+            cache_dir: Directory for cached generations, e.g. DEFAULT_CACHE_DIR.
+                None (the default) disables caching.
         """
-        load_dotenv()
+        if not api_key:
+            _load_env()
         self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
 
         if not self.api_key:
@@ -105,76 +184,207 @@ class MeditationGenerator:
             )
 
         self.client = ElevenLabs(api_key=self.api_key)
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+
+    def _cache_path(self, prompt: str, duration_seconds: float) -> Optional[str]:
+        """Get the cache file for a generation, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            f"{prompt}|{float(duration_seconds)}|{SOUND_EFFECTS_MODEL}".encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def clear_cache(self) -> int:
+        """Delete all cached generations.
+
+        GeneratedAudio objects served from the cache are backed by these
+        files, so they can no longer be read or saved afterwards. Call
+        get_bytes() on any you still need before clearing.
+
+        Returns:
+            Number of cached files removed
+        """
+        if self.cache_dir is None:
+            return 0
+
+        removed = 0
+        for path in glob.glob(os.path.join(self.cache_dir, "*.mp3")):
+            os.remove(path)
+            removed += 1
+        return removed
 
     def generate_sound_effect(
         self,
         prompt: str,
         duration_seconds: float = 10.0,
+        no_cache: bool = False,
     ) -> GeneratedAudio:
         """Generate a sound effect from a text prompt.
 
+        When caching is enabled, identical prompt and duration pairs are
+        served from the on-disk cache instead of calling the API again.
+
         Args:
             prompt: Description of the sound to generate
             duration_seconds: Desired duration (actual may vary)
+            no_cache: If True, skip the cache for this call
 
         Returns:
             GeneratedAudio object with the generated sound
         """
+        cache_path = None if no_cache else self._cache_path(prompt, duration_seconds)
+
+        if cache_path and os.path.exists(cache_path):
+            return GeneratedAudio(
+                audio_data=None,
+                prompt=prompt,
+                duration_seconds=duration_seconds,
+                path=cache_path,
+            )
+
+        result = self.client.text_to_sound_effects.convert(
+            text=prompt,
+            duration_seconds=duration_seconds,
+        )
+
+        if cache_path is None:
+            # Grow one buffer in place instead of holding every chunk for a join
+            buf = bytearray()
+            for chunk in result:
+                buf += chunk
+
+            return GeneratedAudio(
+                audio_data=bytes(buf),
+                prompt=prompt,
+                duration_seconds=duration_seconds,
+            )
+
+        # Stream to a temp file and move it into place so readers never
+        # see a partially written cache entry
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb", buffering=STREAM_BUFFER_SIZE) as f:
+                f.writelines(result)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        return GeneratedAudio(
+            audio_data=None,
+            prompt=prompt,
+            duration_seconds=duration_seconds,
+            path=cache_path,
+        )
+
+    def stream_to_file(
+        self,
+        prompt: str,
+        path: str,
+        duration_seconds: float = 10.0,
+    ) -> GeneratedAudio:
+        """Generate a sound effect and write it to disk as it arrives.
+
+        Unlike generate_sound_effect(), the audio is never held in memory
+        in full, which keeps long generations cheap.
+
+        Args:
+            prompt: Description of the sound to generate
+            path: Output file path
+            duration_seconds: Desired duration (actual may vary)
+
+        Returns:
+            File-backed GeneratedAudio object
+        """
         result = self.client.text_to_sound_effects.convert(
             text=prompt,
             duration_seconds=duration_seconds,
         )
 
-        # Collect all chunks from generator
-        audio_data = b"".join(chunk for chunk in result)
+        with open(path, "wb", buffering=STREAM_BUFFER_SIZE) as f:
+            f.writelines(result)
+        print(f"Saved: {path}")
 
         return GeneratedAudio(
-            audio_data=audio_data,
+            audio_data=None,
             prompt=prompt,
             duration_seconds=duration_seconds,
+            path=path,
         )
 
     def generate_meditation_music(
         self,
         prompt: str,
         duration_seconds: float = 60.0,
+        raw: bool = False,
     ) -> GeneratedAudio:
         """Generate meditation music from a description.
 
         Args:
             prompt: Description of the meditation music to create
             duration_seconds: Desired duration
+            raw: If True, send the prompt as-is without the meditation wording
 
         Returns:
             GeneratedAudio object with the generated music
         """
         # Enhance prompt for better meditation music results
-        enhanced_prompt = f"meditation music: {prompt}, peaceful, calming, ambient"
+        if not raw:
+            prompt = _MEDITATION_PREFIX + prompt + _MEDITATION_SUFFIX
 
         return self.generate_sound_effect(
-            prompt=enhanced_prompt,
+            prompt=prompt,
             duration_seconds=duration_seconds,
         )
 
+    def stream_meditation_music(
+        self,
+        prompt: str,
+        duration_seconds: float = 60.0,
+    ) -> Iterator[bytes]:
+        """Stream instrumental music from the Music API as it is composed.
+
+        Chunks are yielded while generation is still running, so playback
+        or a progressive write to disk can start long before a full
+        multi-minute track would be ready. Requires a paid ElevenLabs plan.
+
+        Args:
+            prompt: Description of the music (genre, mood, instruments, tempo)
+            duration_seconds: Desired duration, up to 300 seconds
+
+        Returns:
+            Iterator of MP3 audio chunks
+        """
+        return self.client.music.stream(
+            prompt=prompt,
+            music_length_ms=int(duration_seconds * 1000),
+            model_id=MUSIC_MODEL,
+            force_instrumental=True,
+        )
+
     def generate_nature_sound(
         self,
         description: str,
         duration_seconds: float = 60.0,
+        raw: bool = False,
     ) -> GeneratedAudio:
         """Generate nature sounds from a description.
 
         Args:
             description: Description of the nature sound (e.g., "rain", "ocean", "forest")
             duration_seconds: Desired duration
+            raw: If True, send the description as-is without the field recording wording
 
         Returns:
             GeneratedAudio object with the generated sound
         """
         # Enhance prompt for nature sounds
-        enhanced_prompt = f"nature sound recording: {description}, high quality field recording, ambient"
+        prompt = description if raw else _NATURE_PREFIX + description + _NATURE_SUFFIX
 
         return self.generate_sound_effect(
-            prompt=enhanced_prompt,
+            prompt=prompt,
             duration_seconds=duration_seconds,
         )
 
@@ -192,13 +402,7 @@ class MeditationGenerator:
         Returns:
             GeneratedAudio object
         """
-        prompts = {
-            "bell": "single meditation bell strike, clear resonant tone, peaceful",
-            "chime": "gentle wind chimes, soft melodic tones, peaceful transition",
-            "bowl": "tibetan singing bowl being struck, deep resonant harmonic tone",
-            "gong": "soft gong strike, deep resonant wash of sound, meditation",
-        }
-
+        prompts = self._TRANSITION_PROMPTS
         prompt = prompts.get(sound_type, prompts["bell"])
 
         return self.generate_sound_effect(
@@ -230,17 +434,29 @@ class MeditationGenerator:
             duration_seconds=duration_seconds,
         )
 
-    @staticmethod
-    def list_presets() -> dict:
+    @classmethod
+    def list_presets(cls) -> Mapping[str, str]:
         """List available meditation presets.
 
         Returns:
-            Dict of preset names to descriptions
+            Read-only mapping of preset names to descriptions
         """
-        return {
-            name: config["description"]
-            for name, config in MeditationGenerator.PRESETS.items()
-        }
+        return cls._PRESET_DESCRIPTIONS
+
+    @staticmethod
+    def _announce_session(
+        intro_seconds: float,
+        main_seconds: float,
+        outro_seconds: float,
+        main_prompt: str,
+    ) -> None:
+        """Print the plan for a session before its requests are issued."""
+        print(
+            "Generating meditation session...\n"
+            f"  Intro: {intro_seconds}s\n"
+            f"  Main: {main_seconds}s - {main_prompt}\n"
+            f"  Outro: {outro_seconds}s"
+        )
 
     def generate_session(
         self,
@@ -251,6 +467,10 @@ class MeditationGenerator:
     ) -> dict:
         """Generate a complete meditation session with intro, main, and outro.
 
+        The three requests run concurrently in a thread pool, so this is
+        safe to call whether or not an event loop is already running.
+        Async callers can await agenerate_session() instead.
+
         Args:
             intro_seconds: Duration of intro transition
             main_seconds: Duration of main meditation music
@@ -260,18 +480,57 @@ class MeditationGenerator:
         Returns:
             Dict with 'intro', 'main', 'outro' GeneratedAudio objects
         """
-        print("Generating meditation session...")
-        print(f"  Intro: {intro_seconds}s")
+        self._announce_session(intro_seconds, main_seconds, outro_seconds, main_prompt)
 
-        intro = self.generate_transition_sound("bowl", duration_seconds=intro_seconds)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            intro = executor.submit(
+                self.generate_transition_sound, "bowl", intro_seconds
+            )
+            main = executor.submit(
+                self.generate_meditation_music, main_prompt, main_seconds
+            )
+            outro = executor.submit(
+                self.generate_transition_sound, "bell", outro_seconds
+            )
 
-        print(f"  Main: {main_seconds}s - {main_prompt}")
-        main = self.generate_meditation_music(
-            main_prompt, duration_seconds=main_seconds
-        )
+        return {
+            "intro": intro.result(),
+            "main": main.result(),
+            "outro": outro.result(),
+            "total_duration": intro_seconds + main_seconds + outro_seconds,
+        }
+
+    async def agenerate_session(
+        self,
+        intro_seconds: float = 30.0,
+        main_seconds: float = 300.0,
+        outro_seconds: float = 30.0,
+        main_prompt: str = "peaceful ambient meditation music",
+    ) -> dict:
+        """Generate a complete meditation session concurrently.
 
-        print(f"  Outro: {outro_seconds}s")
-        outro = self.generate_transition_sound("bell", duration_seconds=outro_seconds)
+        The intro, main, and outro requests are independent, so they are
+        issued together and the total time is that of the slowest one.
+
+        Args:
+            intro_seconds: Duration of intro transition
+            main_seconds: Duration of main meditation music
+            outro_seconds: Duration of outro transition
+            main_prompt: Prompt for the main meditation music
+
+        Returns:
+            Dict with 'intro', 'main', 'outro' GeneratedAudio objects
+        """
+        self._announce_session(intro_seconds, main_seconds, outro_seconds, main_prompt)
+
+        # The sync client blocks on HTTP, so run each request in a worker thread
+        intro, main, outro = await asyncio.gather(
+            asyncio.to_thread(self.generate_transition_sound, "bowl", intro_seconds),
+            asyncio.to_thread(
+                self.generate_meditation_music, main_prompt, main_seconds
+            ),
+            asyncio.to_thread(self.generate_transition_sound, "bell", outro_seconds),
+        )
 
         return {
             "intro": intro,
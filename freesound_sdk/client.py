@@ -1,10 +1,73 @@
 """Freesound API client for discovering meditation sounds."""
 
+import asyncio
+import functools
+import importlib.util
+import json
+import operator
 import os
-from typing import Optional
+import time
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+# orjson parses large search pages noticeably faster than the stdlib
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 needs the optional h2 package on top of httpx
+HAS_HTTP2 = HAS_HTTPX and importlib.util.find_spec("h2") is not None
+
+# Upper bound on simultaneous API requests from the async helpers
+MAX_CONCURRENT_REQUESTS = 10
+
+# Connections kept open to the API, enough for every concurrent request
+MAX_CONNECTIONS = 20
+
+# Retry policy for throttled (429) and transient server errors
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Read and write size for sound downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Largest page the search endpoint returns, which bounds batched lookups
+MAX_PAGE_SIZE = 150
+
+# Fields requested for batched lookups, matching what get_sound() returns
+SOUND_FIELDS = (
+    "id,name,duration,tags,description,license,username,previews,"
+    "download,avg_rating,num_downloads,created"
+)
+
+# Fields every search result carries, fetched in one call per result
+_REQUIRED_FIELDS = operator.itemgetter("id", "name", "duration")
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load variables from a .env file, at most once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _tag_filter(tags: Optional[Sequence[str]]) -> str:
+    """Build the search filter clause that requires every tag."""
+    return " ".join(f'tag:"{tag}"' for tag in tags) if tags else ""
 
 
 class FreesoundClient:
@@ -20,46 +83,59 @@ class FreesoundClient:
     MEDITATION_PRESETS = {
         "nature": {
             "query": "nature ambient",
-            "tags": ["nature", "ambient", "field-recording"],
+            "tags": ("nature", "ambient", "field-recording"),
             "description": "Natural soundscapes - forests, streams, wind",
         },
         "bells": {
             "query": "meditation bell",
-            "tags": ["bell", "meditation", "mindfulness"],
+            "tags": ("bell", "meditation", "mindfulness"),
             "description": "Bells and chimes for meditation cues",
         },
         "bowls": {
             "query": "singing bowl",
-            "tags": ["singing-bowl", "tibetan", "meditation"],
+            "tags": ("singing-bowl", "tibetan", "meditation"),
             "description": "Tibetan singing bowls and resonant tones",
         },
         "rain": {
             "query": "rain ambient",
-            "tags": ["rain", "ambient", "weather"],
+            "tags": ("rain", "ambient", "weather"),
             "description": "Rain and water sounds",
         },
         "ocean": {
             "query": "ocean waves",
-            "tags": ["ocean", "waves", "water"],
+            "tags": ("ocean", "waves", "water"),
             "description": "Ocean waves and beach sounds",
         },
         "forest": {
             "query": "forest birds",
-            "tags": ["forest", "birds", "nature"],
+            "tags": ("forest", "birds", "nature"),
             "description": "Forest ambience with birdsong",
         },
         "drone": {
             "query": "ambient drone",
-            "tags": ["drone", "ambient", "pad"],
+            "tags": ("drone", "ambient", "pad"),
             "description": "Sustained ambient drones and pads",
         },
         "breath": {
             "query": "breathing meditation",
-            "tags": ["breathing", "breath", "meditation"],
+            "tags": ("breathing", "breath", "meditation"),
             "description": "Breathing sounds for pacing",
         },
     }
 
+    # Read-only name -> description view, built once at import
+    _PRESET_DESCRIPTIONS = MappingProxyType(
+        {name: preset["description"] for name, preset in MEDITATION_PRESETS.items()}
+    )
+
+    # Tag filter clause per preset, so preset searches skip rebuilding it
+    _PRESET_TAG_FILTERS = MappingProxyType(
+        {
+            name: _tag_filter(preset.get("tags"))
+            for name, preset in MEDITATION_PRESETS.items()
+        }
+    )
+
     def __init__(
         self,
         client_id: Optional[str] = None,
@@ -71,7 +147,8 @@ class FreesoundClient:
             client_id: Freesound OAuth2 client ID
             client_secret: Freesound OAuth2 client secret (used as API token)
         """
-        load_dotenv()
+        if not (client_id and client_secret):
+            _load_env()
 
         self.client_id = client_id or os.getenv("FREESOUND_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("FREESOUND_CLIENT_SECRET")
@@ -83,44 +160,92 @@ class FreesoundClient:
                 "Get credentials at: https://freesound.org/apiv2/apply"
             )
 
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"Token {self.client_secret}"})
+        self.session = self._create_session()
+
+        # Sound details by ID, so repeated lookups skip the API round trip
+        self._sound_cache: dict[int, dict] = {}
+
+    def _create_session(self):
+        """Create a pooled HTTP session carrying the API token.
+
+        Prefers httpx, which multiplexes requests over one HTTP/2
+        connection when h2 is installed, and falls back to requests.
+        """
+        headers = {"Authorization": f"Token {self.client_secret}"}
+
+        if HAS_HTTPX:
+            # The transport retries failed connections; _get() retries statuses
+            transport = httpx.HTTPTransport(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONNECTIONS,
+                ),
+                retries=MAX_RETRIES,
+            )
+            return httpx.Client(
+                transport=transport,
+                headers=headers,
+                timeout=30,
+                follow_redirects=True,
+            )
+
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            ),
+            pool_connections=MAX_CONNECTIONS,
+            pool_maxsize=MAX_CONNECTIONS,
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _get(self, url: str, params: Optional[dict] = None):
+        """GET a URL, retrying throttled and transient server errors."""
+        response = self.session.get(url, params=params)
+
+        # The requests fallback already retries inside its adapter
+        if HAS_HTTPX:
+            for attempt in range(MAX_RETRIES):
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                time.sleep(RETRY_BACKOFF * 2**attempt)
+                response = self.session.get(url, params=params)
+
+        return response
 
     def _request(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """Make an API request."""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = self.session.get(url, params=params)
+        response = self._get(url, params=params)
         response.raise_for_status()
-        return response.json()
-
-    def search_sounds(
-        self,
-        query: str,
-        tags: Optional[list[str]] = None,
-        duration_range: Optional[tuple[float, float]] = None,
-        page_size: int = 15,
-        sort: str = "score",
-    ) -> list[dict]:
-        """Search for sounds on Freesound.
+        return _json_loads(response.content)
 
-        Args:
-            query: Search query string
-            tags: Optional list of tags to filter by
-            duration_range: Optional (min, max) duration in seconds
-            page_size: Number of results to return (max 150)
-            sort: Sort order - "score", "duration_desc", "duration_asc",
-                  "created_desc", "created_asc", "downloads_desc", "rating_desc"
+    async def _arequest(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """Make an API request without blocking the event loop."""
+        return await asyncio.to_thread(self._request, endpoint, params)
 
-        Returns:
-            List of sound info dicts with 'id', 'name', 'duration', 'tags', 'preview_url', etc.
-        """
+    @staticmethod
+    def _search_params(
+        query: str,
+        tag_filter: str,
+        duration_range: Optional[tuple[float, float]],
+        page_size: int,
+        sort: str,
+    ) -> dict:
+        """Build query parameters for a text search."""
         # Build filter string
         filters = []
         if duration_range:
             filters.append(f"duration:[{duration_range[0]} TO {duration_range[1]}]")
-        if tags:
-            for tag in tags:
-                filters.append(f'tag:"{tag}"')
+        if tag_filter:
+            filters.append(tag_filter)
 
         params = {
             "query": query,
@@ -130,40 +255,92 @@ class FreesoundClient:
         }
         if filters:
             params["filter"] = " ".join(filters)
+        return params
 
-        data = self._request("search/text/", params)
-
+    @staticmethod
+    def _parse_search_results(data: dict) -> list[dict]:
+        """Convert a text search response into sound info dicts."""
+        hq_key, lq_key = "preview-hq-mp3", "preview-lq-mp3"
         sounds = []
+        append = sounds.append
         for sound in data.get("results", []):
-            previews = sound.get("previews", {})
-            sounds.append(
+            sound_id, name, duration = _REQUIRED_FIELDS(sound)
+            get = sound.get
+            previews = get("previews", {})
+            append(
                 {
-                    "id": sound["id"],
-                    "name": sound["name"],
-                    "duration": sound["duration"],
-                    "tags": sound.get("tags", []),
-                    "preview_url": previews.get("preview-hq-mp3", ""),
-                    "preview_lq_url": previews.get("preview-lq-mp3", ""),
-                    "license": sound.get("license", ""),
-                    "username": sound.get("username", ""),
-                    "description": (sound.get("description", "") or "")[:200],
-                    "rating": sound.get("avg_rating", 0),
-                    "downloads": sound.get("num_downloads", 0),
+                    "id": sound_id,
+                    "name": name,
+                    "duration": duration,
+                    "tags": get("tags", []),
+                    "preview_url": previews.get(hq_key, ""),
+                    "preview_lq_url": previews.get(lq_key, ""),
+                    "license": get("license", ""),
+                    "username": get("username", ""),
+                    "description": (get("description", "") or "")[:200],
+                    "rating": get("avg_rating", 0),
+                    "downloads": get("num_downloads", 0),
                 }
             )
 
         return sounds
 
-    def get_meditation_presets(self) -> dict:
+    def search_sounds(
+        self,
+        query: str,
+        tags: Optional[Sequence[str]] = None,
+        duration_range: Optional[tuple[float, float]] = None,
+        page_size: int = 15,
+        sort: str = "score",
+    ) -> list[dict]:
+        """Search for sounds on Freesound.
+
+        Args:
+            query: Search query string
+            tags: Optional sequence of tags to filter by
+            duration_range: Optional (min, max) duration in seconds
+            page_size: Number of results to return (max 150)
+            sort: Sort order - "score", "duration_desc", "duration_asc",
+                  "created_desc", "created_asc", "downloads_desc", "rating_desc"
+
+        Returns:
+            List of sound info dicts with 'id', 'name', 'duration', 'tags', 'preview_url', etc.
+        """
+        params = self._search_params(
+            query, _tag_filter(tags), duration_range, page_size, sort
+        )
+        data = self._request("search/text/", params)
+        return self._parse_search_results(data)
+
+    async def asearch_sounds(
+        self,
+        query: str,
+        tags: Optional[Sequence[str]] = None,
+        duration_range: Optional[tuple[float, float]] = None,
+        page_size: int = 15,
+        sort: str = "score",
+    ) -> list[dict]:
+        """Search for sounds on Freesound without blocking the event loop.
+
+        Takes the same arguments as search_sounds(), so several searches
+        can be awaited together with asyncio.gather().
+
+        Returns:
+            List of sound info dicts
+        """
+        params = self._search_params(
+            query, _tag_filter(tags), duration_range, page_size, sort
+        )
+        data = await self._arequest("search/text/", params)
+        return self._parse_search_results(data)
+
+    def get_meditation_presets(self) -> Mapping[str, str]:
         """Get available meditation-focused search presets.
 
         Returns:
-            Dict of preset names to descriptions
+            Read-only mapping of preset names to descriptions
         """
-        return {
-            name: preset["description"]
-            for name, preset in self.MEDITATION_PRESETS.items()
-        }
+        return self._PRESET_DESCRIPTIONS
 
     def search_preset(
         self,
@@ -185,24 +362,19 @@ class FreesoundClient:
             available = ", ".join(self.MEDITATION_PRESETS.keys())
             raise ValueError(f"Unknown preset '{preset}'. Available: {available}")
 
-        config = self.MEDITATION_PRESETS[preset]
-        return self.search_sounds(
-            query=config["query"],
-            tags=config.get("tags"),
-            duration_range=duration_range,
-            page_size=page_size,
+        params = self._search_params(
+            self.MEDITATION_PRESETS[preset]["query"],
+            self._PRESET_TAG_FILTERS[preset],
+            duration_range,
+            page_size,
+            "score",
         )
+        data = self._request("search/text/", params)
+        return self._parse_search_results(data)
 
-    def get_sound(self, sound_id: int) -> dict:
-        """Get detailed information about a specific sound.
-
-        Args:
-            sound_id: Freesound sound ID
-
-        Returns:
-            Sound info dict with full details
-        """
-        data = self._request(f"sounds/{sound_id}/")
+    @staticmethod
+    def _parse_sound(data: dict) -> dict:
+        """Convert a sound instance response into a sound info dict."""
         previews = data.get("previews", {})
         return {
             "id": data["id"],
@@ -219,32 +391,126 @@ class FreesoundClient:
             "created": data.get("created", ""),
         }
 
-    def download_sound(self, sound_id: int, path: str) -> str:
+    def get_sound(self, sound_id: int) -> dict:
+        """Get detailed information about a specific sound.
+
+        Args:
+            sound_id: Freesound sound ID
+
+        Returns:
+            Sound info dict with full details
+        """
+        if sound_id in self._sound_cache:
+            return self._sound_cache[sound_id]
+
+        sound = self._parse_sound(self._request(f"sounds/{sound_id}/"))
+        self._sound_cache[sound_id] = sound
+        return sound
+
+    def _uncached_batches(self, sound_ids: list[int]) -> list[list[int]]:
+        """Split the IDs missing from the cache into page-sized batches."""
+        missing = [i for i in dict.fromkeys(sound_ids) if i not in self._sound_cache]
+        return [
+            missing[start : start + MAX_PAGE_SIZE]
+            for start in range(0, len(missing), MAX_PAGE_SIZE)
+        ]
+
+    def _fetch_sound_batch(self, sound_ids: list[int]) -> None:
+        """Fetch details for up to MAX_PAGE_SIZE sounds in one request."""
+        params = {
+            "filter": f"id:({' OR '.join(str(i) for i in sound_ids)})",
+            "page_size": len(sound_ids),
+            "fields": SOUND_FIELDS,
+        }
+        data = self._request("search/text/", params)
+        for result in data.get("results", []):
+            sound = self._parse_sound(result)
+            self._sound_cache[sound["id"]] = sound
+
+    def get_sounds(self, sound_ids: list[int]) -> dict[int, dict]:
+        """Get details for many sounds with as few requests as possible.
+
+        Uncached sounds are fetched through an ID-filtered search, one
+        request per MAX_PAGE_SIZE IDs.
+
+        Args:
+            sound_ids: Freesound sound IDs
+
+        Returns:
+            Dict of sound ID to sound info dict (see get_sound()).
+            IDs that Freesound does not return are omitted.
+        """
+        for batch in self._uncached_batches(sound_ids):
+            self._fetch_sound_batch(batch)
+        return {i: self._sound_cache[i] for i in sound_ids if i in self._sound_cache}
+
+    async def aget_sounds(self, sound_ids: list[int]) -> dict[int, dict]:
+        """Get details for many sounds without blocking the event loop.
+
+        Like get_sounds(), but batches are fetched concurrently with at
+        most MAX_CONCURRENT_REQUESTS in flight at once.
+
+        Args:
+            sound_ids: Freesound sound IDs
+
+        Returns:
+            Dict of sound ID to sound info dict (see get_sound())
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(batch: list[int]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self._fetch_sound_batch, batch)
+
+        await asyncio.gather(
+            *(fetch(batch) for batch in self._uncached_batches(sound_ids))
+        )
+        return {i: self._sound_cache[i] for i in sound_ids if i in self._sound_cache}
+
+    def download_sound(
+        self,
+        sound_id: int,
+        path: str,
+        download_url: Optional[str] = None,
+    ) -> str:
         """Download a sound to local file.
 
         Args:
             sound_id: Freesound sound ID
             path: Local path to save the file
+            download_url: Known download URL, which skips the details lookup
 
         Returns:
             Path to downloaded file
         """
-        sound = self.get_sound(sound_id)
-        download_url = sound["download_url"]
+        if download_url is None:
+            download_url = self.get_sound(sound_id)["download_url"]
 
         if not download_url:
             raise ValueError(f"No download URL available for sound {sound_id}")
 
-        response = self.session.get(download_url, stream=True)
-        response.raise_for_status()
-
-        with open(path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        if HAS_HTTPX:
+            with self.session.stream("GET", download_url) as response:
+                response.raise_for_status()
+                self._write_chunks(response.iter_bytes(DOWNLOAD_CHUNK_SIZE), path)
+        else:
+            response = self.session.get(download_url, stream=True)
+            response.raise_for_status()
+            self._write_chunks(
+                response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE), path
+            )
 
-        print(f"Downloaded: {sound['name']} -> {path}")
+        name = self._sound_cache.get(sound_id, {}).get("name", f"sound {sound_id}")
+        print(f"Downloaded: {name} -> {path}")
         return path
 
+    @staticmethod
+    def _write_chunks(chunks, path: str) -> None:
+        """Write downloaded chunks to a local file."""
+        with open(path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk)
+
     def get_attribution(self, sound_id: int) -> str:
         """Get proper attribution text for a sound.
 
@@ -256,10 +522,36 @@ class FreesoundClient:
         Returns:
             Attribution text to include with your project
         """
-        sound = self.get_sound(sound_id)
+        return self._format_attribution(self.get_sound(sound_id))
+
+    def get_attribution_batch(self, sound_ids: list[int]) -> dict[int, str]:
+        """Get attribution text for many sounds in one lookup.
+
+        Sounds the batched search misses are looked up one by one, so every
+        requested ID gets its attribution.
+
+        Args:
+            sound_ids: Freesound sound IDs
+
+        Returns:
+            Dict of sound ID to attribution text
+        """
+        sounds = self.get_sounds(sound_ids)
+        return {
+            sound_id: (
+                self._format_attribution(sounds[sound_id])
+                if sound_id in sounds
+                else self.get_attribution(sound_id)
+            )
+            for sound_id in sound_ids
+        }
+
+    @staticmethod
+    def _format_attribution(sound: dict) -> str:
+        """Build attribution text from a sound info dict."""
         return (
             f'"{sound["name"]}" by {sound["username"]} ({sound["license"]})\n'
-            f"Source: https://freesound.org/s/{sound_id}/"
+            f"Source: https://freesound.org/s/{sound['id']}/"
         )
 
     def preview_url(self, sound_id: int, quality: str = "high") -> str:
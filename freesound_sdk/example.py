@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -25,99 +26,121 @@ def play_audio(path: Path) -> None:
     subprocess.run(["afplay", str(path)], check=True)
 
 
+def _write_lines(*lines: str) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def main():
-    print("=" * 60)
-    print("Freesound SDK - Meditation Sound Discovery Demo")
-    print("=" * 60)
-    print()
+    _write_lines(
+        "=" * 60,
+        "Freesound SDK - Meditation Sound Discovery Demo",
+        "=" * 60,
+        "",
+    )
 
     # Check for API credentials
     load_dotenv()
     if not os.getenv("FREESOUND_CLIENT_SECRET"):
-        print("FREESOUND_CLIENT_SECRET not set!")
-        print()
-        print("To use this SDK:")
-        print("1. Get credentials at: https://freesound.org/apiv2/apply")
-        print("2. Add to .env file:")
-        print("   FREESOUND_CLIENT_ID=your_client_id")
-        print("   FREESOUND_CLIENT_SECRET=your_client_secret")
-        print()
-        print("Demo will show available features without API calls.")
-        print("-" * 40)
-        print()
-
         # Show presets even without API key
-        print("Available Meditation Presets:")
         presets = FreesoundClient.MEDITATION_PRESETS
-        for name, config in presets.items():
-            print(f"  {name}: {config['description']}")
-        print()
+        _write_lines(
+            "FREESOUND_CLIENT_SECRET not set!",
+            "",
+            "To use this SDK:",
+            "1. Get credentials at: https://freesound.org/apiv2/apply",
+            "2. Add to .env file:",
+            "   FREESOUND_CLIENT_ID=your_client_id",
+            "   FREESOUND_CLIENT_SECRET=your_client_secret",
+            "",
+            "Demo will show available features without API calls.",
+            "-" * 40,
+            "",
+            "Available Meditation Presets:",
+            *(f"  {name}: {config['description']}" for name, config in presets.items()),
+            "",
+        )
         return
 
     client = FreesoundClient()
 
-    # Show available presets
-    print("Available Meditation Presets:")
-    print("-" * 40)
-    for name, description in client.get_meditation_presets().items():
-        print(f"  {name}: {description}")
-    print()
-
-    # Search for singing bowls
-    print("Searching for singing bowl sounds (10-30 seconds)...")
-    print("-" * 40)
+    # Show available presets, then search for singing bowls
+    _write_lines(
+        "Available Meditation Presets:",
+        "-" * 40,
+        *(
+            f"  {name}: {description}"
+            for name, description in client.get_meditation_presets().items()
+        ),
+        "",
+        "Searching for singing bowl sounds (10-30 seconds)...",
+        "-" * 40,
+    )
     sounds = client.search_sounds(
         query="singing bowl",
         duration_range=(10, 30),
         page_size=5,
     )
 
+    lines = []
     for sound in sounds:
-        print(f"  [{sound['id']}] {sound['name']}")
-        print(
-            f"        Duration: {sound['duration']:.1f}s | Rating: {sound['rating']:.1f}"
-        )
-        print(f"        Tags: {', '.join(sound['tags'][:5])}")
-        print()
+        lines += [
+            f"  [{sound['id']}] {sound['name']}",
+            f"        Duration: {sound['duration']:.1f}s | Rating: {sound['rating']:.1f}",
+            f"        Tags: {', '.join(sound['tags'][:5])}",
+            "",
+        ]
 
     # Search using a preset
-    print("Searching 'nature' preset for ambient sounds...")
-    print("-" * 40)
+    _write_lines(
+        *lines,
+        "Searching 'nature' preset for ambient sounds...",
+        "-" * 40,
+    )
     nature_sounds = client.search_preset(
         "nature", duration_range=(30, 120), page_size=5
     )
 
+    lines = []
     for sound in nature_sounds:
-        print(f"  [{sound['id']}] {sound['name']}")
-        print(f"        Duration: {sound['duration']:.1f}s")
-        print()
+        lines += [
+            f"  [{sound['id']}] {sound['name']}",
+            f"        Duration: {sound['duration']:.1f}s",
+            "",
+        ]
 
     # Download and play sounds
     if sounds:
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
+            to_play = sounds[:3]  # Play first 3 sounds
+
+            # One lookup covers attribution for every sound played
+            attributions = client.get_attribution_batch(
+                [sound["id"] for sound in to_play]
+            )
 
-            for i, sound in enumerate(sounds[:3]):  # Play first 3 sounds
-                print(f"Downloading and playing sound {i + 1}: {sound['name']}")
-                print("-" * 40)
-                print(f"  ID: {sound['id']}")
-                print(f"  Duration: {sound['duration']:.1f} seconds")
+            for i, sound in enumerate(to_play):
+                lines += [
+                    f"Downloading and playing sound {i + 1}: {sound['name']}",
+                    "-" * 40,
+                    f"  ID: {sound['id']}",
+                    f"  Duration: {sound['duration']:.1f} seconds",
+                ]
 
                 if sound["preview_url"]:
                     mp3_path = tmppath / f"sound_{sound['id']}.mp3"
+                    _write_lines(*lines)
                     download_preview(sound["preview_url"], mp3_path)
-                    print("  Playing preview...")
+                    _write_lines("  Playing preview...")
                     play_audio(mp3_path)
-                    print()
+                    lines = [""]
 
                 # Show attribution
-                attribution = client.get_attribution(sound["id"])
-                print(f"  Attribution: {attribution}")
-                print()
+                lines += [f"  Attribution: {attributions[sound['id']]}", ""]
 
-    print("=" * 60)
-    print("Demo complete!")
-    print("=" * 60)
+    _write_lines(*lines, "=" * 60, "Demo complete!", "=" * 60)
 
 
 if __name__ == "__main__":
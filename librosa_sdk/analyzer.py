@@ -1,24 +1,179 @@
 """Audio analysis for mindfulness qualities using librosa."""
 
+import functools
+import importlib.util
+import math
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 import librosa
 import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+
+try:
+    from threadpoolctl import threadpool_limits
+
+    HAS_THREADPOOLCTL = True
+except ImportError:
+    HAS_THREADPOOLCTL = False
+
+# torchaudio is only imported once an analyzer asks for that backend
+HAS_TORCHAUDIO = importlib.util.find_spec("torchaudio") is not None
+
+# Analysis sample rate (librosa's default), files are resampled to this on load
+TARGET_SAMPLE_RATE = 22050
+
+# Files handed to each batch worker at a time
+BATCH_CHUNK_SIZE = 4
+
+# STFT settings matching librosa's defaults, so both backends agree
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MELS = 128
+
+# HPSS median filter length in frames/bins (librosa's default)
+HPSS_KERNEL_SIZE = 31
+
+# Frames or bins median-filtered per step on the torch backend, bounding the
+# memory of the unfolded windows
+MEDIAN_FILTER_CHUNK = 256
+
+# Category tables: each threshold array splits its score into the bands below
+_TEMPO_EDGES = np.array([70.0, 120.0])  # BPM; a band includes its lower edge
+_TEMPO_CATEGORIES = ("calming", "moderate", "energizing")
+_TEMPO_DESCRIPTIONS = (
+    "Slow tempo ideal for deep relaxation and sleep meditation",
+    "Balanced tempo suitable for mindful movement or light meditation",
+    "Upbeat tempo better suited for active meditation or focus sessions",
+)
+_TEMPO_SCORES = (0.4, 0.2, 0.0)
+
+_WARMTH_EDGES = np.array([0.4, 0.7])  # A band includes its upper edge
+_WARMTH_CHARACTERS = ("bright", "balanced", "warm")
+_WARMTH_DESCRIPTIONS = (
+    "Bright, airy tones that may promote alertness and clarity",
+    "Balanced frequency spectrum suitable for various meditation styles",
+    "Rich, warm tones that promote relaxation and comfort",
+)
+
+_SUITABILITY_EDGES = np.array([0.3, 0.5, 0.7])  # A band includes its lower edge
+_SUITABILITY_LEVELS = ("low", "moderate", "good", "excellent")
+
+
+def _init_batch_worker() -> None:
+    """Keep each worker's BLAS single-threaded so processes don't oversubscribe."""
+    if HAS_THREADPOOLCTL:
+        threadpool_limits(1)
+
+
+def _warmth_score(mean_centroid: float) -> float:
+    """Map a mean spectral centroid to a 0-1 warmth score.
+
+    Higher = warmer, lower = brighter/colder. Typical speech/music
+    centroid range: 500-4000 Hz.
+    """
+    return max(0, min(1, 1 - (mean_centroid - 500) / 3500))
+
+
+@functools.lru_cache(maxsize=8)
+def _torch_transforms(sr: int, device: str) -> tuple:
+    """Get torchaudio spectrogram transforms for a sample rate and device.
+
+    Built once and shared by every analyzer using the torchaudio backend.
+    """
+    import torchaudio.transforms as T
+
+    spectrogram = T.Spectrogram(
+        n_fft=N_FFT, hop_length=HOP_LENGTH, power=1, pad_mode="constant"
+    )
+    mel_scale = T.MelScale(
+        n_mels=N_MELS,
+        sample_rate=sr,
+        n_stft=N_FFT // 2 + 1,
+        norm="slaney",
+        mel_scale="slaney",
+    )
+    to_db = T.AmplitudeToDB("power", top_db=80.0)
+    return spectrogram.to(device), mel_scale.to(device), to_db.to(device)
+
+
+@functools.lru_cache(maxsize=8)
+def _torch_hpss_transforms(device: str) -> tuple:
+    """Get the complex STFT and its inverse for torchaudio HPSS on a device."""
+    import torchaudio.transforms as T
+
+    stft = T.Spectrogram(
+        n_fft=N_FFT, hop_length=HOP_LENGTH, power=None, pad_mode="constant"
+    )
+    istft = T.InverseSpectrogram(n_fft=N_FFT, hop_length=HOP_LENGTH)
+    return stft.to(device), istft.to(device)
+
+
+def _torch_median_filter(x, kernel_size: int, dim: int):
+    """Median-filter a torch tensor along one dimension.
+
+    Edges are mirrored including the edge sample, like scipy.ndimage's
+    "reflect" mode used by librosa, so results match librosa.effects.hpss.
+    Padding wider than the signal keeps reflecting, so short clips work too.
+    """
+    import torch
+
+    pad = kernel_size // 2
+    n = x.shape[dim]
+    # Reflected sample indices repeat with period 2n: 0..n-1, then n-1..0
+    index = torch.arange(-pad, n + pad, device=x.device) % (2 * n)
+    x = x.index_select(dim, torch.where(index < n, index, 2 * n - 1 - index))
+    filtered = []
+    for start in range(0, n, MEDIAN_FILTER_CHUNK):
+        part = x.narrow(dim, start, min(MEDIAN_FILTER_CHUNK, n - start) + 2 * pad)
+        filtered.append(part.unfold(dim, kernel_size, 1).median(dim=-1).values)
+    return torch.cat(filtered, dim)
+
+
+def _analyze_one(audio_path: str) -> dict:
+    """Extract meditation features for a single file in a batch worker."""
+    return MindfulAnalyzer(audio_path).extract_meditation_features()
 
 
 class MindfulAnalyzer:
     """Analyze audio files for meditation and mindfulness qualities."""
 
-    def __init__(self, audio_path: Optional[str] = None):
+    def __init__(
+        self,
+        audio_path: Optional[str] = None,
+        backend: str = "librosa",
+        device: Optional[str] = None,
+    ):
         """Initialize analyzer with optional audio file.
 
         Args:
             audio_path: Path to audio file to analyze
+            backend: "librosa", or "torchaudio" to compute spectrograms with
+                torch (falls back to librosa when torchaudio is not installed)
+            device: Torch device for the torchaudio backend (default: CUDA if
+                available, otherwise CPU)
         """
+        if backend not in ("librosa", "torchaudio"):
+            raise ValueError(
+                f"Unknown backend '{backend}'. Available: librosa, torchaudio"
+            )
+        self.backend = backend if HAS_TORCHAUDIO else "librosa"
+        self.device = device
+        if self.backend == "torchaudio" and device is None:
+            import torch
+
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+
         self.audio_path = audio_path
         self.y: Optional[np.ndarray] = None
         self.sr: Optional[int] = None
 
+        # Spectrograms shared by the analysis methods, built on first use
+        self._magnitude: Optional[np.ndarray] = None
+        self._mel_db: Optional[np.ndarray] = None
+        self._onset_env: Optional[np.ndarray] = None
+
         if audio_path:
             self.load(audio_path)
 
@@ -29,7 +184,20 @@ class MindfulAnalyzer:
             audio_path: Path to audio file
         """
         self.audio_path = audio_path
-        self.y, self.sr = librosa.load(audio_path)
+        try:
+            y, native_sr = sf.read(audio_path, dtype="float32", always_2d=False)
+        except sf.LibsndfileError:
+            # Formats libsndfile can't decode go through librosa's audioread path
+            self.y, self.sr = librosa.load(audio_path, sr=TARGET_SAMPLE_RATE)
+        else:
+            if y.ndim == 2:
+                y = y.mean(axis=1, dtype=np.float32)
+            if native_sr != TARGET_SAMPLE_RATE:
+                g = math.gcd(native_sr, TARGET_SAMPLE_RATE)
+                y = resample_poly(y, TARGET_SAMPLE_RATE // g, native_sr // g)
+                y = y.astype(np.float32, copy=False)
+            self.y, self.sr = y, TARGET_SAMPLE_RATE
+        self._clear_spectrograms()
 
     def load_from_array(self, y: np.ndarray, sr: int) -> None:
         """Load audio from numpy array.
@@ -40,6 +208,74 @@ class MindfulAnalyzer:
         """
         self.y = y
         self.sr = sr
+        self._clear_spectrograms()
+
+    def _clear_spectrograms(self) -> None:
+        """Drop cached spectrograms after new audio is loaded."""
+        self._magnitude = None
+        self._mel_db = None
+        self._onset_env = None
+
+    def _magnitude_spectrogram(self) -> np.ndarray:
+        """Get the STFT magnitude of the loaded audio, computing it once."""
+        if self._magnitude is None:
+            if self.backend == "torchaudio":
+                self._torch_spectrograms()
+            else:
+                self._magnitude = np.abs(librosa.stft(self.y))
+        return self._magnitude
+
+    def _mel_spectrogram_db(self) -> np.ndarray:
+        """Get the log-power mel spectrogram, derived from the cached STFT."""
+        if self._mel_db is None:
+            if self.backend == "torchaudio":
+                self._torch_spectrograms()
+                return self._mel_db
+            mel = librosa.feature.melspectrogram(
+                S=self._magnitude_spectrogram() ** 2, sr=self.sr
+            )
+            self._mel_db = librosa.power_to_db(mel)
+        return self._mel_db
+
+    def _torch_spectrograms(self) -> None:
+        """Compute and cache both spectrograms on the torch device in one pass."""
+        import torch
+
+        spectrogram, mel_scale, to_db = _torch_transforms(self.sr, self.device)
+        with torch.inference_mode():
+            y = torch.as_tensor(self.y, dtype=torch.float32, device=self.device)
+            magnitude = spectrogram(y)
+            mel_db = to_db(mel_scale(magnitude.square()))
+        self._magnitude = magnitude.cpu().numpy()
+        self._mel_db = mel_db.cpu().numpy()
+
+    def _onset_envelope(self) -> np.ndarray:
+        """Get the onset strength envelope, derived from the cached mel spectrogram."""
+        if self._onset_env is None:
+            # Median aggregation matches the envelope beat_track builds itself
+            self._onset_env = librosa.onset.onset_strength(
+                S=self._mel_spectrogram_db(), sr=self.sr, aggregate=np.median
+            )
+        return self._onset_env
+
+    @staticmethod
+    def analyze_batch(paths: list[str], workers: Optional[int] = None) -> list[dict]:
+        """Extract meditation features for many files in parallel.
+
+        Each file is analyzed in its own worker process, so a library of
+        tracks scales across CPU cores.
+
+        Args:
+            paths: Paths to audio files to analyze
+            workers: Number of worker processes (default: one per CPU)
+
+        Returns:
+            List of extract_meditation_features() dicts, in the order of paths
+        """
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_batch_worker
+        ) as executor:
+            return list(executor.map(_analyze_one, paths, chunksize=BATCH_CHUNK_SIZE))
 
     def analyze_tempo(self) -> dict:
         """Detect BPM and categorize as calming, moderate, or energizing.
@@ -50,27 +286,21 @@ class MindfulAnalyzer:
         if self.y is None:
             raise ValueError("No audio loaded. Call load() first.")
 
-        tempo, _ = librosa.beat.beat_track(y=self.y, sr=self.sr)
-        bpm = float(tempo) if np.isscalar(tempo) else float(tempo[0])
-
-        if bpm < 70:
-            category = "calming"
-            description = "Slow tempo ideal for deep relaxation and sleep meditation"
-        elif bpm < 120:
-            category = "moderate"
-            description = (
-                "Balanced tempo suitable for mindful movement or light meditation"
-            )
+        # Only the BPM is needed, so estimate it from the onset envelope
+        # without running the full beat tracker
+        onset_env = self._onset_envelope()
+        if onset_env.any():
+            tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=self.sr)
+            bpm = float(tempo[0])
         else:
-            category = "energizing"
-            description = (
-                "Upbeat tempo better suited for active meditation or focus sessions"
-            )
+            bpm = 0.0  # No onsets to estimate a tempo from
+
+        band = int(np.searchsorted(_TEMPO_EDGES, bpm, side="right"))
 
         return {
             "bpm": round(bpm, 1),
-            "category": category,
-            "description": description,
+            "category": _TEMPO_CATEGORIES[band],
+            "description": _TEMPO_DESCRIPTIONS[band],
         }
 
     def analyze_spectral_warmth(self) -> dict:
@@ -82,31 +312,26 @@ class MindfulAnalyzer:
         if self.y is None:
             raise ValueError("No audio loaded. Call load() first.")
 
-        # Spectral centroid indicates brightness
-        centroid = librosa.feature.spectral_centroid(y=self.y, sr=self.sr)
+        # Spectral centroid indicates brightness: the magnitude-weighted mean
+        # frequency of each frame, taken straight from the cached STFT
+        magnitude = self._magnitude_spectrogram()
+        freqs = librosa.fft_frequencies(sr=self.sr, n_fft=2 * (len(magnitude) - 1))
+        weights = magnitude.sum(axis=0)
+        centroid = np.divide(
+            freqs @ magnitude, weights, out=np.zeros(len(weights)), where=weights > 0
+        )
         mean_centroid = float(np.mean(centroid))
 
-        # Normalize to 0-1 scale (higher = brighter/colder, lower = warmer)
-        # Typical speech/music centroid range: 500-4000 Hz
-        warmth_score = max(0, min(1, 1 - (mean_centroid - 500) / 3500))
-
-        if warmth_score > 0.7:
-            character = "warm"
-            description = "Rich, warm tones that promote relaxation and comfort"
-        elif warmth_score > 0.4:
-            character = "balanced"
-            description = (
-                "Balanced frequency spectrum suitable for various meditation styles"
-            )
-        else:
-            character = "bright"
-            description = "Bright, airy tones that may promote alertness and clarity"
+        # Normalize to 0-1 scale
+        warmth_score = _warmth_score(mean_centroid)
+
+        band = int(np.searchsorted(_WARMTH_EDGES, warmth_score, side="left"))
 
         return {
             "centroid_hz": round(mean_centroid, 1),
             "warmth_score": round(warmth_score, 2),
-            "character": character,
-            "description": description,
+            "character": _WARMTH_CHARACTERS[band],
+            "description": _WARMTH_DESCRIPTIONS[band],
         }
 
     def extract_meditation_features(self) -> dict:
@@ -125,7 +350,7 @@ class MindfulAnalyzer:
         warmth_info = self.analyze_spectral_warmth()
 
         # MFCCs for timbral texture
-        mfccs = librosa.feature.mfcc(y=self.y, sr=self.sr, n_mfcc=13)
+        mfccs = librosa.feature.mfcc(S=self._mel_spectrogram_db(), n_mfcc=13)
         mfcc_variance = float(np.mean(np.var(mfccs, axis=1)))
 
         # Zero-crossing rate (higher = more percussive/noisy)
@@ -138,11 +363,7 @@ class MindfulAnalyzer:
         dynamics = "stable" if rms_std < 0.05 else "dynamic"
 
         # Overall meditation suitability score
-        score = 0.0
-        if tempo_info["category"] == "calming":
-            score += 0.4
-        elif tempo_info["category"] == "moderate":
-            score += 0.2
+        score = _TEMPO_SCORES[_TEMPO_CATEGORIES.index(tempo_info["category"])]
         if warmth_info["warmth_score"] > 0.5:
             score += 0.3
         if dynamics == "stable":
@@ -150,14 +371,8 @@ class MindfulAnalyzer:
         if mean_zcr < 0.1:
             score += 0.1
 
-        if score >= 0.7:
-            suitability = "excellent"
-        elif score >= 0.5:
-            suitability = "good"
-        elif score >= 0.3:
-            suitability = "moderate"
-        else:
-            suitability = "low"
+        band = int(np.searchsorted(_SUITABILITY_EDGES, score, side="right"))
+        suitability = _SUITABILITY_LEVELS[band]
 
         return {
             "tempo_bpm": tempo_info["bpm"],
@@ -171,6 +386,87 @@ class MindfulAnalyzer:
             "suitability": suitability,
         }
 
+    def stream_features(
+        self, block_sec: float = 10.0, audio_path: Optional[str] = None
+    ) -> dict:
+        """Measure warmth, dynamics and percussiveness without loading the file.
+
+        Reads the file block by block and keeps running totals, so memory
+        stays at one block even for hour-long soundscapes. Frames are taken
+        at the file's native sample rate without centering.
+
+        Args:
+            block_sec: Length of each block read from disk in seconds
+            audio_path: File to analyze (default: the analyzer's audio_path)
+
+        Returns:
+            dict with 'duration_sec', 'centroid_hz', 'warmth_score',
+            'warmth_character', 'rms_mean', 'dynamics', and 'percussiveness'
+        """
+        audio_path = audio_path or self.audio_path
+        if audio_path is None:
+            raise ValueError("No audio file given. Pass audio_path or call load().")
+
+        # Consecutive blocks overlap by one frame minus one hop, so their
+        # frames tile the file exactly as a single pass would
+        overlap = N_FFT - HOP_LENGTH
+        frame_args = dict(frame_length=N_FFT, hop_length=HOP_LENGTH)
+        n_frames = 0
+        centroid_sum = rms_sum = rms_sq_sum = zcr_sum = 0.0
+
+        with sf.SoundFile(audio_path) as f:
+            sr = f.samplerate
+            duration = f.frames / sr
+            freqs = librosa.fft_frequencies(sr=sr, n_fft=N_FFT)
+            hops = max(1, int(block_sec * sr) // HOP_LENGTH)
+            for block in f.blocks(
+                blocksize=hops * HOP_LENGTH + overlap,
+                overlap=overlap,
+                dtype="float32",
+                always_2d=True,
+            ):
+                if len(block) < N_FFT:
+                    break  # Tail shorter than one frame
+                y = block.mean(axis=1, dtype=np.float32)
+
+                magnitude = np.abs(
+                    librosa.stft(y, n_fft=N_FFT, hop_length=HOP_LENGTH, center=False)
+                )
+                weights = magnitude.sum(axis=0)
+                centroid = np.divide(
+                    freqs @ magnitude,
+                    weights,
+                    out=np.zeros(len(weights)),
+                    where=weights > 0,
+                )
+                rms = librosa.feature.rms(y=y, center=False, **frame_args)[0]
+                zcr = librosa.feature.zero_crossing_rate(y, center=False, **frame_args)
+
+                n_frames += len(rms)
+                centroid_sum += float(centroid.sum())
+                rms_sum += float(rms.sum(dtype=np.float64))
+                rms_sq_sum += float(np.dot(rms, rms))
+                zcr_sum += float(zcr.sum(dtype=np.float64))
+
+        if n_frames == 0:
+            raise ValueError("Audio is shorter than one analysis frame.")
+
+        mean_centroid = centroid_sum / n_frames
+        warmth_score = _warmth_score(mean_centroid)
+        rms_mean = rms_sum / n_frames
+        rms_std = math.sqrt(max(0.0, rms_sq_sum / n_frames - rms_mean**2))
+        band = int(np.searchsorted(_WARMTH_EDGES, warmth_score, side="left"))
+
+        return {
+            "duration_sec": round(duration, 2),
+            "centroid_hz": round(mean_centroid, 1),
+            "warmth_score": round(warmth_score, 2),
+            "warmth_character": _WARMTH_CHARACTERS[band],
+            "rms_mean": round(rms_mean, 4),
+            "dynamics": "stable" if rms_std < 0.05 else "dynamic",
+            "percussiveness": round(zcr_sum / n_frames, 4),
+        }
+
     def detect_silence_gaps(
         self, min_silence_ms: int = 500, silence_thresh_db: float = -40
     ) -> list[dict]:
@@ -183,6 +479,33 @@ class MindfulAnalyzer:
         Returns:
             List of dicts with 'start_sec', 'end_sec', 'duration_sec'
         """
+        starts, ends, durations = self.detect_silence_gaps_arrays(
+            min_silence_ms, silence_thresh_db
+        )
+
+        gaps = [
+            {"start_sec": start, "end_sec": end, "duration_sec": duration}
+            for start, end, duration in zip(
+                np.round(starts, 2).tolist(),
+                np.round(ends, 2).tolist(),
+                np.round(durations, 2).tolist(),
+            )
+        ]
+
+        return gaps
+
+    def detect_silence_gaps_arrays(
+        self, min_silence_ms: int = 500, silence_thresh_db: float = -40
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find silence gaps as NumPy arrays, for callers that aggregate them.
+
+        Args:
+            min_silence_ms: Minimum silence duration in milliseconds
+            silence_thresh_db: Threshold below which audio is considered silence
+
+        Returns:
+            Tuple of (start_sec, end_sec, duration_sec) float arrays, one entry per gap
+        """
         if self.y is None:
             raise ValueError("No audio loaded. Call load() first.")
 
@@ -195,39 +518,20 @@ class MindfulAnalyzer:
         frame_duration = hop_length / self.sr
         min_frames = int(min_silence_ms / 1000 / frame_duration)
 
-        silent_frames = db < silence_thresh_db
-        gaps = []
-        start_frame = None
-
-        for i, is_silent in enumerate(silent_frames):
-            if is_silent and start_frame is None:
-                start_frame = i
-            elif not is_silent and start_frame is not None:
-                if i - start_frame >= min_frames:
-                    gaps.append(
-                        {
-                            "start_sec": round(start_frame * frame_duration, 2),
-                            "end_sec": round(i * frame_duration, 2),
-                            "duration_sec": round(
-                                (i - start_frame) * frame_duration, 2
-                            ),
-                        }
-                    )
-                start_frame = None
-
-        # Handle trailing silence
-        if start_frame is not None and len(silent_frames) - start_frame >= min_frames:
-            gaps.append(
-                {
-                    "start_sec": round(start_frame * frame_duration, 2),
-                    "end_sec": round(len(silent_frames) * frame_duration, 2),
-                    "duration_sec": round(
-                        (len(silent_frames) - start_frame) * frame_duration, 2
-                    ),
-                }
-            )
-
-        return gaps
+        # Pad with non-silent frames so every silent run has a rising and a
+        # falling edge, including runs that reach the end of the audio
+        silent_frames = (db < silence_thresh_db).astype(np.int8)
+        edges = np.diff(np.concatenate(([0], silent_frames, [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        lengths = ends - starts
+
+        keep = lengths >= min_frames
+        return (
+            starts[keep] * frame_duration,
+            ends[keep] * frame_duration,
+            lengths[keep] * frame_duration,
+        )
 
     def separate_harmonic_percussive(self) -> tuple[np.ndarray, np.ndarray]:
         """Isolate ambient textures from rhythmic elements.
@@ -238,9 +542,39 @@ class MindfulAnalyzer:
         if self.y is None:
             raise ValueError("No audio loaded. Call load() first.")
 
+        if self.backend == "torchaudio":
+            return self._torch_hpss()
+
         harmonic, percussive = librosa.effects.hpss(self.y)
         return harmonic, percussive
 
+    def _torch_hpss(self) -> tuple[np.ndarray, np.ndarray]:
+        """Run librosa's median-filtering HPSS with torch on the analyzer's device."""
+        import torch
+
+        stft, istft = _torch_hpss_transforms(self.device)
+        with torch.inference_mode():
+            y = torch.as_tensor(self.y, dtype=torch.float32, device=self.device)
+            spectrum = stft(y)
+            magnitude = spectrum.abs()
+
+            # Harmonics are smooth across time, percussion across frequency
+            harm = _torch_median_filter(magnitude, HPSS_KERNEL_SIZE, dim=-1)
+            perc = _torch_median_filter(magnitude, HPSS_KERNEL_SIZE, dim=-2)
+
+            # Soft masks as in librosa.util.softmask, splitting silent bins evenly
+            scale = torch.maximum(harm, perc)
+            silent = scale < torch.finfo(scale.dtype).tiny
+            scale[silent] = 1
+            harm_power = (harm / scale).square()
+            perc_power = (perc / scale).square()
+            mask_harm = harm_power / (harm_power + perc_power)
+            mask_harm[silent] = 0.5
+
+            harmonic = istft(spectrum * mask_harm, length=len(self.y))
+            percussive = istft(spectrum * (1 - mask_harm), length=len(self.y))
+        return harmonic.cpu().numpy(), percussive.cpu().numpy()
+
     def get_duration(self) -> float:
         """Get duration of loaded audio in seconds."""
         if self.y is None:
@@ -1,9 +1,41 @@
 """Audio recording utilities for journaling and soundscape capture."""
 
+import math
+import threading
+
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
 
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Capacity of the continuous recording buffer before its first doubling
+INITIAL_BUFFER_SECONDS = 60.0
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _block_rms(block: np.ndarray) -> float:
+        """Get the RMS level of an audio block without allocating temporaries."""
+        samples = block.ravel()
+        total = 0.0
+        for i in range(samples.size):
+            total += samples[i] * samples[i]
+        return math.sqrt(total / samples.size)
+
+else:
+
+    def _block_rms(block: np.ndarray) -> float:
+        """Get the RMS level of an audio block."""
+        samples = block.ravel()
+        return math.sqrt(float(np.dot(samples, samples)) / samples.size)
+
 
 class AudioRecorder:
     """Record audio from microphone for voice journaling and soundscape creation."""
@@ -18,7 +50,8 @@ class AudioRecorder:
         self.sample_rate = sample_rate
         self.channels = channels
         self._recording = False
-        self._audio_buffer: list[np.ndarray] = []
+        self._audio_buffer = np.empty((0, channels), dtype=np.float32)
+        self._write_idx = 0
 
     def record_audio(self, duration: float) -> np.ndarray:
         """Record audio for a fixed duration.
@@ -66,24 +99,36 @@ class AudioRecorder:
         silence_blocks_needed = int(silence_duration / 0.1)
         max_blocks = int(timeout / 0.1)
 
-        self._audio_buffer = []
+        # Blocks land directly in a buffer sized for the longest allowed recording
+        audio = np.empty((max(max_blocks, 1) * block_size, self.channels), np.float32)
+        write_idx = 0
         silence_count = 0
         total_blocks = 0
         min_blocks = int(min_duration / 0.1)
+        stop_event = threading.Event()
+
+        # Compile the RMS kernel now rather than inside the first callback
+        _block_rms(np.zeros((block_size, self.channels), dtype=np.float32))
 
         print("Recording... (will stop after silence)")
 
         def callback(indata, frames, time, status):
-            nonlocal silence_count, total_blocks
-            self._audio_buffer.append(indata.copy())
+            nonlocal write_idx, silence_count, total_blocks
+            n = min(frames, len(audio) - write_idx)
+            np.copyto(audio[write_idx : write_idx + n], indata[:n])
+            write_idx += n
             total_blocks += 1
 
-            rms = np.sqrt(np.mean(indata**2))
+            rms = _block_rms(indata)
             if rms < silence_threshold and total_blocks >= min_blocks:
                 silence_count += 1
             else:
                 silence_count = 0
 
+            if silence_count >= silence_blocks_needed or total_blocks >= max_blocks:
+                stop_event.set()
+                raise sd.CallbackStop
+
         with sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
@@ -91,12 +136,14 @@ class AudioRecorder:
             blocksize=block_size,
             callback=callback,
         ):
-            while silence_count < silence_blocks_needed and total_blocks < max_blocks:
-                sd.sleep(100)
+            # Woken by the callback; the timeout only guards against a stalled stream
+            stop_event.wait(timeout=timeout + 1.0)
 
         print("Recording complete.")
-        audio = np.concatenate(self._audio_buffer)
-        return audio.flatten() if self.channels == 1 else audio
+        if write_idx < len(audio):
+            # Copy out the recorded part so the timeout-sized buffer can be freed
+            audio = audio[:write_idx].copy()
+        return audio.reshape(-1) if self.channels == 1 else audio
 
     def start_recording(self) -> None:
         """Start continuous recording (non-blocking).
@@ -106,12 +153,25 @@ class AudioRecorder:
         if self._recording:
             raise RuntimeError("Already recording")
 
-        self._audio_buffer = []
+        capacity = int(INITIAL_BUFFER_SECONDS * self.sample_rate)
+        self._audio_buffer = np.empty((capacity, self.channels), dtype=np.float32)
+        self._write_idx = 0
         self._recording = True
 
         def callback(indata, frames, time, status):
-            if self._recording:
-                self._audio_buffer.append(indata.copy())
+            if not self._recording:
+                return
+            end = self._write_idx + frames
+            if end > len(self._audio_buffer):
+                # Double the capacity so growing stays O(1) per block on average
+                grown = np.empty(
+                    (max(end, 2 * len(self._audio_buffer)), self.channels),
+                    dtype=np.float32,
+                )
+                grown[: self._write_idx] = self._audio_buffer[: self._write_idx]
+                self._audio_buffer = grown
+            np.copyto(self._audio_buffer[self._write_idx : end], indata)
+            self._write_idx = end
 
         self._stream = sd.InputStream(
             samplerate=self.sample_rate,
@@ -136,11 +196,14 @@ class AudioRecorder:
         self._stream.close()
         print("Recording stopped.")
 
-        if not self._audio_buffer:
+        audio, self._audio_buffer = self._audio_buffer, None
+        if self._write_idx == 0:
             return np.array([], dtype=np.float32)
 
-        audio = np.concatenate(self._audio_buffer)
-        return audio.flatten() if self.channels == 1 else audio
+        if self._write_idx < len(audio):
+            # Copy out the recorded part so the growable buffer can be freed
+            audio = audio[: self._write_idx].copy()
+        return audio.reshape(-1) if self.channels == 1 else audio
 
     def save_recording(
         self,
@@ -164,24 +227,22 @@ class AudioRecorder:
         Returns:
             Dict with device information
         """
-        devices = sd.query_devices()
-        input_devices = []
-
-        for i, device in enumerate(devices):
-            if device["max_input_channels"] > 0:
-                input_devices.append(
-                    {
-                        "index": i,
-                        "name": device["name"],
-                        "channels": device["max_input_channels"],
-                        "sample_rate": device["default_samplerate"],
-                        "is_default": i == sd.default.device[0],
-                    }
-                )
+        default_index = sd.default.device[0]
+        input_devices = [
+            {
+                "index": i,
+                "name": device["name"],
+                "channels": device["max_input_channels"],
+                "sample_rate": device["default_samplerate"],
+                "is_default": i == default_index,
+            }
+            for i, device in enumerate(sd.query_devices())
+            if device["max_input_channels"] > 0
+        ]
 
         return {
             "devices": input_devices,
-            "default": sd.default.device[0],
+            "default": default_index,
         }
 
     def set_input_device(self, device_index: int) -> None:
@@ -1,6 +1,21 @@
 """WebAudio SDK - Therapeutic tone generation for meditation."""
 
 from .binaural import BinauralGenerator
-from .playback import play_audio, save_audio
+from .playback import (
+    get_audio_devices,
+    play_audio,
+    save_audio,
+    save_audio_stream,
+    stop_playback,
+    wait_playback,
+)
 
-__all__ = ["BinauralGenerator", "play_audio", "save_audio"]
+__all__ = [
+    "BinauralGenerator",
+    "get_audio_devices",
+    "play_audio",
+    "save_audio",
+    "save_audio_stream",
+    "stop_playback",
+    "wait_playback",
+]
@@ -1,7 +1,207 @@
 """Binaural beat and isochronic tone generation."""
 
+import contextlib
+import functools
+import threading
+from collections.abc import Iterator
+
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Tones at least this long use the fused Numba kernels when available
+NUMBA_MIN_SAMPLES = 1 << 20
+
+# Oscillators rotate a block of this many samples from each block's start phase
+ROTATOR_BLOCK = 4096
+
+# Rotated blocks materialized at once, bounding the complex64 scratch memory
+ROTATOR_CHUNK_BLOCKS = 256
+
+# Longest index vector kept in the shared cache (8 MB of float64)
+INDEX_CACHE_MAX_SAMPLES = 1 << 20
+
+# Released buffers kept for reuse per (shape, dtype); extras are left to the GC
+POOL_MAX_PER_KEY = 4
+
+# Free lists of released output buffers, keyed by (shape, dtype)
+_POOL: dict[tuple, list[np.ndarray]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _acquire(shape: tuple[int, ...], dtype=np.float32) -> np.ndarray:
+    """Get an uninitialized buffer, reusing a released one when possible."""
+    key = (tuple(shape), np.dtype(dtype).str)
+    with _POOL_LOCK:
+        free = _POOL.get(key)
+        if free:
+            return free.pop()
+    return np.empty(shape, dtype=dtype)
+
+
+def _release(audio: np.ndarray) -> None:
+    """Return a buffer to the pool; views and foreign arrays are ignored."""
+    if not audio.flags.owndata or not audio.flags.c_contiguous:
+        return
+    key = (audio.shape, audio.dtype.str)
+    with _POOL_LOCK:
+        free = _POOL.setdefault(key, [])
+        if len(free) < POOL_MAX_PER_KEY and not any(a is audio for a in free):
+            free.append(audio)
+
+
+def _sample_indices(n: int) -> np.ndarray:
+    """Get a float64 0..n-1 index vector, shared between calls when short.
+
+    Phases are index times cycles per sample, so every oscillator of the
+    same length (and every rotator block) scales the same vector. Longer
+    vectors are built fresh rather than pinned in the cache.
+    """
+    if n > INDEX_CACHE_MAX_SAMPLES:
+        return np.arange(n, dtype=np.float64)
+    return _cached_sample_indices(n)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_sample_indices(n: int) -> np.ndarray:
+    indices = np.arange(n, dtype=np.float64)
+    indices.setflags(write=False)
+    return indices
+
+
+@functools.lru_cache(maxsize=32)
+def _fade_curves(fade_samples: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get read-only linear fade-in and fade-out ramps of a given length.
+
+    Sessions reuse a handful of fade lengths, so the ramps are built once
+    and shared between calls.
+    """
+    fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    fade_in.setflags(write=False)  # Before taking the view, so both are frozen
+    return fade_in, fade_in[::-1]
+
+
+@functools.lru_cache(maxsize=32)
+def _pulse_envelope(period: int, duty_cycle: float) -> np.ndarray:
+    """Get one read-only period of the isochronic pulse envelope.
+
+    A sine hump over the first duty_cycle of the period, silent for the
+    rest. Pulse rates that divide the sample rate repeat this exactly.
+    """
+    if duty_cycle <= 0:
+        envelope = np.zeros(period, dtype=np.float32)
+        envelope.setflags(write=False)
+        return envelope
+
+    phase = (np.arange(period) / period).astype(np.float32)
+    envelope = np.sin(
+        np.float32(np.pi / duty_cycle) * phase,
+        where=phase < duty_cycle,
+        out=np.zeros(period, dtype=np.float32),
+    )
+    envelope.setflags(write=False)
+    return envelope
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _binaural_kernel(
+        out: np.ndarray,
+        starts: np.ndarray,
+        rotator: np.ndarray,
+        fade_samples: int,
+    ) -> None:
+        """Write both ears and the fades of a binaural beat in a single pass.
+
+        Mirrors generate_binaural_beat's NumPy path: every block of each
+        ear is its start phase times the ear's rotator powers.
+        """
+        n = out.shape[0]
+        step = 1.0 / (fade_samples - 1) if fade_samples > 1 else 0.0  # As linspace
+        for block in prange(starts.shape[0]):
+            first = block * ROTATOR_BLOCK
+            length = min(ROTATOR_BLOCK, n - first)
+
+            # Blocks clear of both fades skip the gain math entirely
+            if fade_samples <= first and first + length <= n - fade_samples:
+                left, right = starts[block, 0], starts[block, 1]
+                for k in range(length):
+                    out[first + k, 0] = (left * rotator[k, 0]).imag
+                    out[first + k, 1] = (right * rotator[k, 1]).imag
+                continue
+
+            for k in range(length):
+                i = first + k
+                gain = np.float32(1.0)
+                if i < fade_samples:
+                    gain = np.float32(i * step)
+                elif i >= n - fade_samples:
+                    gain = np.float32((n - 1 - i) * step)
+                out[i, 0] = (starts[block, 0] * rotator[k, 0]).imag * gain
+                out[i, 1] = (starts[block, 1] * rotator[k, 1]).imag * gain
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _isochronic_kernel(
+        out: np.ndarray,
+        starts: np.ndarray,
+        rotator: np.ndarray,
+        pulse_step: float,
+        duty_cycle: float,
+        fade_samples: int,
+    ) -> None:
+        """Write the carrier, pulse envelope and fades of an isochronic tone.
+
+        Mirrors generate_isochronic_tones' NumPy path, with the pulse
+        phase wrapped in float64 like _cycles.
+        """
+        n = out.shape[0]
+        step = 1.0 / (fade_samples - 1) if fade_samples > 1 else 0.0  # As linspace
+        # A non-positive duty cycle never sounds: every phase is >= it below
+        pulse_scale = np.float32(np.pi / duty_cycle if duty_cycle > 0 else 0.0)
+        for block in prange(starts.shape[0]):
+            first = block * ROTATOR_BLOCK
+            for k in range(min(ROTATOR_BLOCK, n - first)):
+                i = first + k
+                cycles = i * pulse_step
+                phase = np.float32(cycles - np.floor(cycles))
+                if phase >= duty_cycle:
+                    out[i] = 0.0
+                    continue
+                gain = np.sin(pulse_scale * phase)
+                if i < fade_samples:
+                    gain *= np.float32(i * step)
+                elif i >= n - fade_samples:
+                    gain *= np.float32((n - 1 - i) * step)
+                out[i] = (starts[block] * rotator[k]).imag * gain
+
+
+@functools.cache
+def _warm_kernels() -> None:
+    """Compile (or load from cache) the Numba kernels once per process.
+
+    Done on the first long signal, so short clips and streamed sessions,
+    which never reach the kernels, don't pay for the JIT at startup.
+    """
+    if not HAS_NUMBA:
+        return
+    starts = np.ones((1, 2), dtype=np.complex64)
+    rotator = np.ones((ROTATOR_BLOCK, 2), dtype=np.complex64)
+    _binaural_kernel(np.empty((4, 2), dtype=np.float32), starts, rotator, 1)
+    _isochronic_kernel(
+        np.empty(4, dtype=np.float32),
+        starts[:, 0].copy(),
+        rotator[:, 0].copy(),
+        0.1,
+        0.5,
+        1,
+    )
+
 
 class BinauralGenerator:
     """Generate binaural beats and isochronic tones for meditation.
@@ -72,18 +272,79 @@ class BinauralGenerator:
             Stereo numpy array of shape (samples, 2)
         """
         samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, samples)
 
         # Left ear: base frequency
         # Right ear: base frequency + beat frequency
-        left = np.sin(2 * np.pi * base_freq * t)
-        right = np.sin(2 * np.pi * (base_freq + beat_freq) * t)
+        audio = _acquire((samples, 2))
+        if HAS_NUMBA and samples >= NUMBA_MIN_SAMPLES:
+            _warm_kernels()
+            starts, rotator = self._rotator(
+                np.array([base_freq, base_freq + beat_freq]), samples
+            )
+            _binaural_kernel(
+                audio, starts, rotator, self._fade_length(samples, fade_duration)
+            )
+            return audio
+
+        # Both ears are rotated straight into the interleaved output; the
+        # rotator's imag parts are strided anyway, and rendering separate
+        # L/R arrays would need an extra full interleaving pass
+        self._oscillate(base_freq, samples, out=audio[:, 0])
+        self._oscillate(base_freq + beat_freq, samples, out=audio[:, 1])
 
         # Apply fade in/out
-        audio = np.column_stack([left, right])
-        audio = self._apply_fade(audio, fade_duration)
+        return self._apply_fade(audio, fade_duration)
+
+    def stream_binaural_beat(
+        self,
+        base_freq: float,
+        beat_freq: float,
+        duration: float,
+        fade_duration: float = 2.0,
+        chunk_size: int = ROTATOR_BLOCK,
+    ) -> Iterator[np.ndarray]:
+        """Generate binaural beats block by block, for sessions too long to hold.
+
+        Each block starts from its float64-wrapped phase, so the stream
+        matches generate_binaural_beat however long it runs.
+
+        Args:
+            base_freq: Base carrier frequency in Hz (100-400 recommended)
+            beat_freq: Desired binaural beat frequency in Hz (0.5-30)
+            duration: Duration in seconds
+            fade_duration: Fade in/out duration in seconds
+            chunk_size: Frames per yielded block
 
-        return audio.astype(np.float32)
+        Yields:
+            Stereo float32 blocks of shape (chunk_size, 2); the last may be shorter
+        """
+        samples = int(duration * self.sample_rate)
+        step = np.array([base_freq, base_freq + beat_freq]) / self.sample_rate
+        rotator = np.exp(
+            2j * np.pi * np.multiply.outer(_sample_indices(chunk_size), step)
+        ).astype(np.complex64)
+
+        fade_samples = self._fade_length(samples, fade_duration)
+        fade_in, fade_out = _fade_curves(fade_samples)
+        fade_start = samples - fade_samples
+
+        rotated = np.empty_like(rotator)
+        for first in range(0, samples, chunk_size):
+            n = min(chunk_size, samples - first)
+            cycles = first * step
+            cycles -= np.floor(cycles)
+            start = np.exp(2j * np.pi * cycles).astype(np.complex64)
+            block = np.multiply(start, rotator[:n], out=rotated[:n]).imag.copy()
+
+            if first < fade_samples:
+                m = min(n, fade_samples - first)
+                block[:m] *= fade_in[first : first + m, np.newaxis]
+            if first + n > fade_start:
+                lo = max(first, fade_start)
+                block[lo - first :] *= fade_out[
+                    lo - fade_start : first + n - fade_start, np.newaxis
+                ]
+            yield block
 
     def generate_isochronic_tones(
         self,
@@ -102,33 +363,59 @@ class BinauralGenerator:
             freq: Tone frequency in Hz
             pulse_rate: Pulses per second (same as brainwave target frequency)
             duration: Duration in seconds
-            duty_cycle: Fraction of time the tone is on (0-1)
+            duty_cycle: Fraction of time the tone is on (0-1); 0 or less is silence
             fade_duration: Fade in/out duration in seconds
 
         Returns:
             Mono numpy array
         """
         samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, samples)
 
-        # Generate carrier tone
-        carrier = np.sin(2 * np.pi * freq * t)
-
-        # Generate pulse envelope
-        pulse_period = 1.0 / pulse_rate
-        pulse_on_time = pulse_period * duty_cycle
-        envelope = np.zeros(samples)
-
-        for i, time in enumerate(t):
-            phase = time % pulse_period
-            if phase < pulse_on_time:
-                # Smooth pulse shape using sine
-                envelope[i] = np.sin(np.pi * phase / pulse_on_time)
+        audio = _acquire((samples,))
+        if duty_cycle <= 0:
+            # The tone is never on, as the baseline's empty pulse mask gave
+            audio.fill(0)
+            return audio
+
+        if HAS_NUMBA and samples >= NUMBA_MIN_SAMPLES:
+            _warm_kernels()
+            starts, rotator = self._rotator(freq, samples)
+            _isochronic_kernel(
+                audio,
+                starts,
+                rotator,
+                pulse_rate / self.sample_rate,
+                duty_cycle,
+                self._fade_length(samples, fade_duration),
+            )
+            return audio
 
-        audio = carrier * envelope
-        audio = self._apply_fade(audio.reshape(-1, 1), fade_duration).flatten()
+        # Generate carrier tone
+        self._oscillate(freq, samples, out=audio)
+
+        # Whole-sample pulse periods tile one cached period over the carrier
+        period = self.sample_rate / pulse_rate
+        if period.is_integer():
+            envelope = _pulse_envelope(int(period), duty_cycle)
+            whole = samples - samples % len(envelope)
+            periods = audio[:whole].reshape(-1, len(envelope))
+            periods *= envelope
+            audio[whole:] *= envelope[: samples - whole]
+            return self._apply_fade(audio, fade_duration)
+
+        # Otherwise build the pulse envelope from the position within each pulse period
+        pulse_phase = self._cycles(pulse_rate, samples)
+
+        # Smooth pulse shape using sine, silent for the rest of each period
+        pulse_on = pulse_phase < duty_cycle
+        envelope = np.multiply(
+            pulse_phase, np.float32(np.pi / duty_cycle), out=pulse_phase
+        )
+        np.sin(envelope, out=envelope)
+        envelope *= pulse_on
 
-        return audio.astype(np.float32)
+        audio *= envelope
+        return self._apply_fade(audio, fade_duration)
 
     def generate_from_preset(
         self, preset: str, duration: float, fade_duration: float = 2.0
@@ -172,25 +459,155 @@ class BinauralGenerator:
             Stereo numpy array
         """
         samples = int(duration * self.sample_rate)
-        combined = np.zeros((samples, 2))
+        combined = _acquire((samples, 2))
+        combined.fill(0)
 
         for layer in layers:
             amplitude = layer.get("amplitude", 1.0 / len(layers))
-            audio = self.generate_binaural_beat(
-                base_freq=layer["base_freq"],
-                beat_freq=layer["beat_freq"],
-                duration=duration,
-                fade_duration=0,  # Apply fade to combined signal
-            )
-            combined += audio * amplitude
+            left_freq = layer["base_freq"]
+            right_freq = layer["base_freq"] + layer["beat_freq"]
+
+            # Accumulate each scaled ear straight into the mix; fade the sum at the end
+            for channel, freq in enumerate((left_freq, right_freq)):
+                self._oscillate(
+                    freq,
+                    samples,
+                    out=combined[:, channel],
+                    amplitude=amplitude,
+                    accumulate=True,
+                )
 
         # Normalize to prevent clipping
-        max_val = np.max(np.abs(combined))
+        max_val = max(combined.max(), -combined.min())
         if max_val > 0:
-            combined = combined / max_val * 0.9
+            combined *= 0.9 / max_val
+
+        return self._apply_fade(combined, fade_duration)
+
+    def release(self, audio: np.ndarray) -> None:
+        """Hand generated audio back for reuse by later generate_* calls.
+
+        Only call this once nothing else reads the array; its memory will be
+        overwritten by the next generation of the same shape. Non-blocking
+        play_audio() plays its own copy, so releasing right after it is safe.
+
+        Args:
+            audio: Array returned by one of the generate_* methods
+        """
+        _release(audio)
+
+    @contextlib.contextmanager
+    def scratch(self, shape: tuple[int, ...]) -> Iterator[np.ndarray]:
+        """Borrow a float32 buffer from the pool for the duration of a block.
+
+        Args:
+            shape: Buffer shape, e.g. (samples, 2)
+
+        Yields:
+            Uninitialized float32 array, released when the block exits
+        """
+        buffer = _acquire(shape)
+        try:
+            yield buffer
+        finally:
+            _release(buffer)
+
+    def _rotator(
+        self, freq: float | np.ndarray, samples: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get block start phases and rotator powers for a complex oscillator.
+
+        Sample k of block b is Im(starts[b] * rotator[k]). Block start
+        phases are wrapped in float64, so rounding can't accumulate from
+        block to block however long the session runs.
+
+        Args:
+            freq: Frequency in Hz, or an array of frequencies (one column each)
+            samples: Number of samples
+
+        Returns:
+            Tuple of complex64 (starts, rotator) arrays, shaped (blocks, ...)
+            and (ROTATOR_BLOCK, ...)
+        """
+        step = np.divide(freq, self.sample_rate)
+        offsets = np.multiply.outer(_sample_indices(ROTATOR_BLOCK), step)
+        rotator = np.exp(2j * np.pi * offsets).astype(np.complex64)
+
+        cycles = np.multiply.outer(
+            _sample_indices(-(-samples // ROTATOR_BLOCK)), step * ROTATOR_BLOCK
+        )
+        cycles -= np.floor(cycles)
+        starts = np.exp(2j * np.pi * cycles).astype(np.complex64)
+        return starts, rotator
+
+    def _oscillate(
+        self,
+        freq: float,
+        samples: int,
+        out: np.ndarray | None = None,
+        amplitude: float = 1.0,
+        accumulate: bool = False,
+    ) -> np.ndarray:
+        """Generate a sine wave with a block complex rotator.
+
+        Each block is one complex multiply per sample against a shared run
+        of rotator powers, so no sine is evaluated per sample. The
+        amplitude is folded into the block start phases for free.
+
+        Args:
+            freq: Frequency in Hz
+            samples: Number of samples
+            out: Optional float32 array (or column view) to write into
+            amplitude: Peak amplitude of the sine
+            accumulate: Add the sine into out instead of overwriting it
+
+        Returns:
+            float32 sine wave (out, when given)
+        """
+        if out is None:
+            out = np.empty(samples, dtype=np.float32)
+
+        starts, rotator = self._rotator(freq, samples)
+        if amplitude != 1.0:
+            starts *= np.float32(amplitude)
+
+        chunk = ROTATOR_BLOCK * ROTATOR_CHUNK_BLOCKS
+        scratch = np.empty((ROTATOR_CHUNK_BLOCKS, ROTATOR_BLOCK), dtype=np.complex64)
+        for first in range(0, samples, chunk):
+            n = min(chunk, samples - first)
+            block = first // ROTATOR_BLOCK
+            rows = -(-n // ROTATOR_BLOCK)
+            rotated = np.multiply.outer(
+                starts[block : block + rows], rotator, out=scratch[:rows]
+            )
+            sine = rotated.imag.reshape(-1)[:n]
+            if accumulate:
+                out[first : first + n] += sine
+            else:
+                out[first : first + n] = sine
+        return out
+
+    def _cycles(self, freq: float, samples: int) -> np.ndarray:
+        """Get the position within each cycle of freq for every sample.
+
+        The running phase is wrapped in float64 so long sessions keep
+        their accuracy, then handed back as float32 in [0, 1) for shaping
+        envelopes in single precision.
+
+        Args:
+            freq: Frequency in Hz
+            samples: Number of samples
+
+        Returns:
+            float32 array of cycle fractions
+        """
+        cycles = _sample_indices(samples) * (freq / self.sample_rate)
+        cycles %= 1.0
+        return cycles.astype(np.float32)
 
-        combined = self._apply_fade(combined, fade_duration)
-        return combined.astype(np.float32)
+    def _fade_length(self, samples: int, fade_duration: float) -> int:
+        """Get the fade length in samples, capped at 25% of the audio."""
+        return min(int(fade_duration * self.sample_rate), samples // 4)
 
     def _apply_fade(self, audio: np.ndarray, fade_duration: float) -> np.ndarray:
         """Apply fade in and fade out to audio.
@@ -202,13 +619,13 @@ class BinauralGenerator:
         Returns:
             Audio with fades applied
         """
-        fade_samples = int(fade_duration * self.sample_rate)
-        fade_samples = min(fade_samples, len(audio) // 4)  # Max 25% of duration
+        fade_samples = self._fade_length(len(audio), fade_duration)
 
         if fade_samples > 0:
-            fade_in = np.linspace(0, 1, fade_samples)
-            fade_out = np.linspace(1, 0, fade_samples)
+            fade_in, fade_out = _fade_curves(fade_samples)
 
+            # Only the two edge regions are scaled in place; a full-length
+            # envelope would spend a multiply on every sample of the middle
             if audio.ndim == 2:
                 audio[:fade_samples] *= fade_in[:, np.newaxis]
                 audio[-fade_samples:] *= fade_out[:, np.newaxis]
@@ -1,30 +1,47 @@
 """Example: Generate and play binaural beats for meditation."""
 
+import os
+import sys
+
 from webaudio_sdk import BinauralGenerator, play_audio, save_audio
 
 
+def _write_lines(*lines: str) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def main():
-    print("=" * 60)
-    print("WebAudio SDK - Binaural Beat Generation Demo")
-    print("=" * 60)
-    print()
+    _write_lines(
+        "=" * 60,
+        "WebAudio SDK - Binaural Beat Generation Demo",
+        "=" * 60,
+        "",
+    )
 
     generator = BinauralGenerator(sample_rate=44100)
 
     # Show available presets
-    print("Available Presets:")
-    print("-" * 40)
-    for name, description in generator.list_presets().items():
-        print(f"  {name}: {description}")
-    print()
+    _write_lines(
+        "Available Presets:",
+        "-" * 40,
+        *(
+            f"  {name}: {description}"
+            for name, description in generator.list_presets().items()
+        ),
+        "",
+    )
 
     # Generate theta waves for meditation (6 Hz)
-    print("Generating Theta Waves (6 Hz) for Meditation...")
-    print("-" * 40)
-    print("  Base frequency: 200 Hz")
-    print("  Beat frequency: 6 Hz (Theta range)")
-    print("  Duration: 10 seconds")
-    print()
+    _write_lines(
+        "Generating Theta Waves (6 Hz) for Meditation...",
+        "-" * 40,
+        "  Base frequency: 200 Hz",
+        "  Beat frequency: 6 Hz (Theta range)",
+        "  Duration: 10 seconds",
+        "",
+    )
 
     binaural = generator.generate_binaural_beat(
         base_freq=200,
@@ -33,26 +50,31 @@ def main():
         fade_duration=2,
     )
 
-    print(f"  Generated audio shape: {binaural.shape}")
-    print(f"  Left channel: {200} Hz")
-    print(f"  Right channel: {200 + 6} Hz")
-    print("  Perceived beat: 6 Hz (Theta)")
-    print()
+    _write_lines(
+        f"  Generated audio shape: {binaural.shape}",
+        f"  Left channel: {200} Hz",
+        f"  Right channel: {200 + 6} Hz",
+        "  Perceived beat: 6 Hz (Theta)",
+        "",
+    )
 
     # Generate from preset
-    print("Generating from 'relaxation' preset...")
-    print("-" * 40)
+    _write_lines("Generating from 'relaxation' preset...", "-" * 40)
     relaxation = generator.generate_from_preset("relaxation", duration=10)
-    print(f"  Generated {len(relaxation) / 44100:.1f} seconds of Alpha waves")
-    print()
+    _write_lines(
+        f"  Generated {len(relaxation) / 44100:.1f} seconds of Alpha waves", ""
+    )
+    generator.release(relaxation)
 
     # Generate isochronic tones
-    print("Generating Isochronic Tones (10 Hz Alpha)...")
-    print("-" * 40)
-    print("  Tone frequency: 300 Hz")
-    print("  Pulse rate: 10 Hz (Alpha range)")
-    print("  Duration: 10 seconds")
-    print()
+    _write_lines(
+        "Generating Isochronic Tones (10 Hz Alpha)...",
+        "-" * 40,
+        "  Tone frequency: 300 Hz",
+        "  Pulse rate: 10 Hz (Alpha range)",
+        "  Duration: 10 seconds",
+        "",
+    )
 
     isochronic = generator.generate_isochronic_tones(
         freq=300,
@@ -61,47 +83,54 @@ def main():
         duty_cycle=0.5,
     )
 
-    print(f"  Generated audio shape: {isochronic.shape}")
-    print()
+    _write_lines(f"  Generated audio shape: {isochronic.shape}", "")
+    generator.release(isochronic)
 
     # Generate layered binaural
-    print("Generating Layered Binaural Beats...")
-    print("-" * 40)
     layers = [
         {"base_freq": 150, "beat_freq": 4, "amplitude": 0.5},  # Theta
         {"base_freq": 300, "beat_freq": 10, "amplitude": 0.5},  # Alpha
     ]
-    print("  Layer 1: 150 Hz base, 4 Hz beat (Theta)")
-    print("  Layer 2: 300 Hz base, 10 Hz beat (Alpha)")
-    print()
+    _write_lines(
+        "Generating Layered Binaural Beats...",
+        "-" * 40,
+        "  Layer 1: 150 Hz base, 4 Hz beat (Theta)",
+        "  Layer 2: 300 Hz base, 10 Hz beat (Alpha)",
+        "",
+    )
 
     layered = generator.generate_layered_binaural(layers, duration=10)
-    print(f"  Generated layered audio shape: {layered.shape}")
-    print()
+    _write_lines(f"  Generated layered audio shape: {layered.shape}", "")
+    generator.release(layered)
 
     # Save to file
     output_path = "theta_meditation.wav"
-    print(f"Saving theta waves to {output_path}...")
+    _write_lines(f"Saving theta waves to {output_path}...")
     save_audio(binaural, output_path, sample_rate=44100)
-    print("  Saved successfully!")
-    print()
-
-    # Play audio
-    print("Playing theta waves (10 seconds)...")
-    print("  Use headphones for binaural effect!")
-    print("-" * 40)
-    play_audio(binaural, sample_rate=44100, blocking=True)
-    print()
-
-    print("=" * 60)
-    print("Demo complete!")
-    print()
-    print("Tips for best results:")
-    print("  - Use headphones (required for binaural beats)")
-    print("  - Find a quiet, comfortable space")
-    print("  - Close your eyes and focus on breathing")
-    print("  - Sessions of 15-30 minutes are most effective")
-    print("=" * 60)
+    _write_lines("  Saved successfully!", "")
+
+    # Play audio, unless WEBAUDIO_SDK_PLAY=0 (e.g. in CI without audio hardware)
+    if os.environ.get("WEBAUDIO_SDK_PLAY", "1") != "0":
+        _write_lines(
+            "Playing theta waves (10 seconds)...",
+            "  Use headphones for binaural effect!",
+            "-" * 40,
+        )
+        play_audio(binaural, sample_rate=44100, blocking=True)
+    generator.release(binaural)
+
+    _write_lines(
+        "",
+        "=" * 60,
+        "Demo complete!",
+        "",
+        "Tips for best results:",
+        "  - Use headphones (required for binaural beats)",
+        "  - Find a quiet, comfortable space",
+        "  - Close your eyes and focus on breathing",
+        "  - Sessions of 15-30 minutes are most effective",
+        "=" * 60,
+    )
 
 
 if __name__ == "__main__":
@@ -2,14 +2,6 @@
 
 import argparse
 import sys
-import numpy as np
-from webaudio_sdk import BinauralGenerator
-import soundfile as sf
-
-
-def save_audio(audio: np.ndarray, path: str, sample_rate: int = 44100) -> None:
-    """Save audio to a file without requiring sounddevice."""
-    sf.write(path, audio, sample_rate)
 
 
 def main():
@@ -63,53 +55,67 @@ def main():
     args = parser.parse_args()
 
     # Validate arguments
-    if args.base_freq <= 0:
-        print("Error: base-freq must be positive", file=sys.stderr)
-        sys.exit(1)
-    if args.beat_freq <= 0:
-        print("Error: beat-freq must be positive", file=sys.stderr)
-        sys.exit(1)
-    if args.duration <= 0:
-        print("Error: duration must be positive", file=sys.stderr)
-        sys.exit(1)
+    for name, value in (
+        ("base-freq", args.base_freq),
+        ("beat-freq", args.beat_freq),
+        ("duration", args.duration),
+    ):
+        if value <= 0:
+            parser.error(f"{name} must be positive")
+
+    # Imported only once the arguments are known good, so --help and bad
+    # invocations skip loading the generator and its audio backends
+    from webaudio_sdk import BinauralGenerator
+    from webaudio_sdk.playback import save_audio, save_audio_stream
 
-    print("=" * 60)
-    print("Binaural Beat Generator")
-    print("=" * 60)
-    print(f"Base frequency: {args.base_freq} Hz")
-    print(f"Beat frequency: {args.beat_freq} Hz")
-    print(f"Duration: {args.duration} seconds")
-    print(f"Fade duration: {args.fade_duration} seconds")
-    print(f"Sample rate: {args.sample_rate} Hz")
-    print(f"Tone type: {args.tone_type}")
-    print()
+    # Write the settings banner in one go
+    banner = [
+        "=" * 60,
+        "Binaural Beat Generator",
+        "=" * 60,
+        f"Base frequency: {args.base_freq} Hz",
+        f"Beat frequency: {args.beat_freq} Hz",
+        f"Duration: {args.duration} seconds",
+        f"Fade duration: {args.fade_duration} seconds",
+        f"Sample rate: {args.sample_rate} Hz",
+        f"Tone type: {args.tone_type}",
+        "",
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
 
     # Generate audio
     print(f"Generating {args.tone_type} tones...")
     generator = BinauralGenerator(sample_rate=args.sample_rate)
 
     if args.tone_type == "binaural":
-        audio = generator.generate_binaural_beat(
+        # Stream blocks straight to disk so long sessions never sit in memory
+        blocks = generator.stream_binaural_beat(
             base_freq=args.base_freq,
             beat_freq=args.beat_freq,
             duration=args.duration,
             fade_duration=args.fade_duration,
         )
+        print(f"Saving to {args.output}...")
+        frames = save_audio_stream(
+            blocks, args.output, sample_rate=args.sample_rate, channels=2
+        )
+        print(f"Generated audio shape: ({frames}, 2)")
     else:  # isochronic
-        audio = generator.generate_isochronic_tone(
+        audio = generator.generate_isochronic_tones(
             freq=args.base_freq,
-            beat_freq=args.beat_freq,
+            pulse_rate=args.beat_freq,
             duration=args.duration,
             fade_duration=args.fade_duration,
         )
 
-    print(f"Generated audio shape: {audio.shape}")
+        print(f"Generated audio shape: {audio.shape}")
+
+        # Save to file
+        print(f"Saving to {args.output}...")
+        save_audio(audio, args.output, sample_rate=args.sample_rate)
+        generator.release(audio)
 
-    # Save to file
-    print(f"Saving to {args.output}...")
-    save_audio(audio, args.output, sample_rate=args.sample_rate)
-    print(f"✓ Successfully saved to {args.output}")
-    print("=" * 60)
+    sys.stdout.write(f"✓ Successfully saved to {args.output}\n" + "=" * 60 + "\n")
 
 
 if __name__ == "__main__":
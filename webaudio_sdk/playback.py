@@ -1,13 +1,79 @@
 """Audio playback and export utilities."""
 
+import threading
+import time
+from collections.abc import Iterable
+
 import numpy as np
-try:
-    import sounddevice as sd
-    HAS_SOUNDDEVICE = True
-except OSError:
-    HAS_SOUNDDEVICE = False
 import soundfile as sf
 
+# Frames handed to PortAudio per write while streaming playback
+PLAYBACK_BLOCK_SIZE = 1024
+
+# Set to cut short the playback currently streaming
+_playback_stop = threading.Event()
+
+# Background playback thread, and the error it died with until wait_playback
+_playback = {"thread": None, "error": None}
+
+# Seconds a device listing is reused before PortAudio is queried again
+DEVICE_CACHE_TTL = 2.0
+
+# Last device listing and the monotonic time it was taken
+_device_cache = {"time": 0.0, "devices": None}
+
+
+def _require_sounddevice(purpose: str):
+    """Import sounddevice on first use, so file-only callers never load PortAudio.
+
+    Args:
+        purpose: What sounddevice is needed for, used in the error message
+
+    Returns:
+        The sounddevice module
+    """
+    try:
+        import sounddevice as sd
+    except (ImportError, OSError):
+        raise RuntimeError(
+            "sounddevice is not available. "
+            f"PortAudio library is required for {purpose}."
+        ) from None
+    return sd
+
+
+def _open_stream(audio: np.ndarray, sample_rate: int):
+    """Open an output stream for audio, raising device errors to the caller."""
+    sd = _require_sounddevice("playback")
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    return sd.OutputStream(
+        samplerate=sample_rate,
+        channels=channels,
+        dtype="float32",
+        blocksize=PLAYBACK_BLOCK_SIZE,
+        latency="low",
+    )
+
+
+def _stream_audio(stream, audio: np.ndarray, stop: threading.Event) -> None:
+    """Write audio to an open output stream block by block until done or stopped."""
+    with stream:
+        for start in range(0, len(audio), PLAYBACK_BLOCK_SIZE):
+            if stop.is_set():
+                stream.abort()
+                return
+            stream.write(audio[start:start + PLAYBACK_BLOCK_SIZE])
+
+
+def _stream_audio_in_background(
+    stream, audio: np.ndarray, stop: threading.Event
+) -> None:
+    """Run _stream_audio, keeping any error for wait_playback to re-raise."""
+    try:
+        _stream_audio(stream, audio, stop)
+    except Exception as exc:
+        _playback["error"] = exc
+
 
 def play_audio(
     audio: np.ndarray,
@@ -19,26 +85,62 @@ def play_audio(
     Args:
         audio: Audio data as numpy array (mono or stereo)
         sample_rate: Sample rate in Hz
-        blocking: If True, wait for playback to complete
+        blocking: If True, wait for playback to complete. Otherwise device
+            errors during playback are raised by wait_playback(), and the
+            audio is copied first so the caller may reuse or release it
     """
-    if not HAS_SOUNDDEVICE:
-        raise RuntimeError("sounddevice is not available. PortAudio library is required for playback.")
-    sd.play(audio, sample_rate)
+    global _playback_stop
+
+    # PortAudio plays float32 natively, so convert float64 input once up front
+    if blocking:
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+    else:
+        # Background playback owns its copy; the caller's array may be a pooled
+        # buffer that is handed out and overwritten while this still plays
+        audio = np.array(audio, dtype=np.float32, order="C")
+
+    # Like sd.play, starting new audio cuts off whatever is still playing
+    _playback_stop.set()
+    _playback_stop = threading.Event()
+
+    # Opened here so a missing or busy device fails in the caller, as with sd.play
+    stream = _open_stream(audio, sample_rate)
+
     if blocking:
-        sd.wait()
+        _stream_audio(stream, audio, _playback_stop)
+    else:
+        _playback["thread"] = threading.Thread(
+            target=_stream_audio_in_background,
+            args=(stream, audio, _playback_stop),
+            daemon=True,
+        )
+        _playback["thread"].start()
+
+
+def wait_playback() -> None:
+    """Wait for non-blocking playback to finish, like sd.wait.
+
+    Raises:
+        Exception: Whatever error stopped the background playback, if any
+    """
+    thread = _playback["thread"]
+    if thread is not None:
+        thread.join()
+    error, _playback["error"] = _playback["error"], None
+    if error is not None:
+        raise error
 
 
 def stop_playback() -> None:
     """Stop any currently playing audio."""
-    if not HAS_SOUNDDEVICE:
-        raise RuntimeError("sounddevice is not available. PortAudio library is required for playback.")
-    sd.stop()
+    _playback_stop.set()
 
 
 def save_audio(
     audio: np.ndarray,
     path: str,
     sample_rate: int = 44100,
+    subtype: str | None = None,
 ) -> None:
     """Save audio to a file.
 
@@ -46,34 +148,100 @@ def save_audio(
         audio: Audio data as numpy array
         path: Output file path (supports .wav, .flac, .ogg)
         sample_rate: Sample rate in Hz
+        subtype: libsndfile subtype such as "FLOAT"; defaults to the format's
+            own (PCM_16 for .wav and .flac, VORBIS for .ogg)
+    """
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    sf.write(path, audio, sample_rate, subtype=subtype)
+
+
+def save_audio_stream(
+    blocks: Iterable[np.ndarray],
+    path: str,
+    sample_rate: int = 44100,
+    channels: int = 2,
+    subtype: str | None = None,
+) -> int:
+    """Save audio to a file one block at a time.
+
+    Only one block is held in memory, so sessions of any length can be
+    written, e.g. from BinauralGenerator.stream_binaural_beat.
+
+    Args:
+        blocks: Iterable of audio blocks, each (frames, channels) or 1D for mono
+        path: Output file path (supports .wav, .flac, .ogg)
+        sample_rate: Sample rate in Hz
+        channels: Number of channels in every block
+        subtype: libsndfile subtype; defaults to the format's own
+
+    Returns:
+        Number of frames written
     """
-    sf.write(path, audio, sample_rate)
+    frames = 0
+    with sf.SoundFile(
+        path, "w", samplerate=sample_rate, channels=channels, subtype=subtype
+    ) as f:
+        for block in blocks:
+            f.write(np.ascontiguousarray(block, dtype=np.float32))
+            frames += len(block)
+    return frames
 
 
 def get_audio_devices() -> dict:
     """Get available audio input and output devices.
 
     Returns:
-        Dict with 'input' and 'output' device lists
+        Dict with 'input' and 'output' device lists, the caller's to modify
     """
-    if not HAS_SOUNDDEVICE:
-        raise RuntimeError("sounddevice is not available. PortAudio library is required for device detection.")
-    
+    sd = _require_sounddevice("device detection")
+
+    now = time.monotonic()
+    cached = _device_cache["devices"]
+    if cached is not None and now - _device_cache["time"] < DEVICE_CACHE_TTL:
+        return _copy_devices(cached)
+
     devices = sd.query_devices()
     input_devices = []
     output_devices = []
 
+    # One lookup per field; duplex devices get a separate entry in each list
     for i, device in enumerate(devices):
-        info = {
-            "index": i,
-            "name": device["name"],
-            "sample_rate": device["default_samplerate"],
-        }
-        if device["max_input_channels"] > 0:
-            info["channels"] = device["max_input_channels"]
-            input_devices.append(info)
-        if device["max_output_channels"] > 0:
-            info["channels"] = device["max_output_channels"]
-            output_devices.append(info)
-
-    return {"input": input_devices, "output": output_devices}
+        name = device["name"]
+        sample_rate = device["default_samplerate"]
+        input_channels = device["max_input_channels"]
+        output_channels = device["max_output_channels"]
+        if input_channels > 0:
+            input_devices.append(
+                {
+                    "index": i,
+                    "name": name,
+                    "sample_rate": sample_rate,
+                    "channels": input_channels,
+                }
+            )
+        if output_channels > 0:
+            output_devices.append(
+                {
+                    "index": i,
+                    "name": name,
+                    "sample_rate": sample_rate,
+                    "channels": output_channels,
+                }
+            )
+
+    _device_cache["devices"] = {"input": input_devices, "output": output_devices}
+    _device_cache["time"] = now
+    return _copy_devices(_device_cache["devices"])
+
+
+def _copy_devices(devices: dict) -> dict:
+    """Copy a device listing so callers can't alter the cached one."""
+    return {
+        kind: [dict(device) for device in listing]
+        for kind, listing in devices.items()
+    }
+
+
+def invalidate_audio_devices_cache() -> None:
+    """Forget the cached device listing, e.g. after a device is plugged in."""
+    _device_cache["devices"] = None